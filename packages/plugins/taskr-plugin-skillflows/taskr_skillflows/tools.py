@@ -2,7 +2,6 @@
 Skillflow MCP tools for Taskr.
 """
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -85,10 +84,10 @@ def register(mcp: "FastMCP", plugin: "SkillflowsPlugin") -> None:
             """,
             skillflow.id, skillflow.name, skillflow.title, skillflow.description,
             skillflow.status, skillflow.version,
-            [json.dumps(i) for i in skillflow.inputs],
-            [json.dumps(o) for o in skillflow.outputs],
-            [json.dumps(p) for p in skillflow.preconditions],
-            [json.dumps(s) for s in skillflow.steps],
+            skillflow.inputs,
+            skillflow.outputs,
+            skillflow.preconditions,
+            skillflow.steps,
             skillflow.tags, skillflow.author,
             skillflow.created_at, skillflow.updated_at,
         )
@@ -325,7 +324,7 @@ def register(mcp: "FastMCP", plugin: "SkillflowsPlugin") -> None:
             VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7)
             """,
             execution.id, execution.skillflow_id, execution.skillflow_name,
-            execution.agent_id, execution.status, json.dumps(execution.inputs),
+            execution.agent_id, execution.status, execution.inputs,
             execution.started_at,
         )
 
@@ -392,8 +391,8 @@ def register(mcp: "FastMCP", plugin: "SkillflowsPlugin") -> None:
             WHERE id = $7
             """,
             status,
-            json.dumps(outputs or {}),
-            [json.dumps(r) for r in (step_results or [])],
+            outputs or {},
+            step_results or [],
             error_message, now, duration_ms, execution_id,
         )
 
@@ -511,7 +510,7 @@ def register(mcp: "FastMCP", plugin: "SkillflowsPlugin") -> None:
 
         if steps:
             updates.append(f"steps = ${len(params)+1}::jsonb[]")
-            params.append([json.dumps(s) for s in steps])
+            params.append(steps)
             updates.append("version = version + 1")
 
         if tags:
@@ -2,7 +2,6 @@
 Supabase MCP tools for Taskr.
 """
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -94,7 +93,7 @@ def register(mcp: "FastMCP", plugin: "SupabasePlugin") -> None:
             VALUES ($1, $2, $3, $4, $5::jsonb)
             """,
             function_name, project_ref, "deployed", datetime.utcnow(),
-            json.dumps({"verify_jwt": verify_jwt, "code_length": len(function_code)}),
+            {"verify_jwt": verify_jwt, "code_length": len(function_code)},
         )
 
         return {
@@ -32,6 +32,8 @@ class DatabaseConfig:
     type: str = "sqlite"  # "sqlite" or "postgres"
     sqlite_path: str = "~/.taskr/taskr.db"
     postgres_url: str | None = None
+    postgres_pool_min: int = 1
+    postgres_pool_max: int = 10
 
 
 @dataclass
@@ -106,6 +108,8 @@ def _parse_database_config(data: dict) -> DatabaseConfig:
         type=db_type,
         sqlite_path=sqlite_path,
         postgres_url=postgres_url,
+        postgres_pool_min=int(postgres_config.get("pool_min_size", 1)),
+        postgres_pool_max=int(postgres_config.get("pool_max_size", 10)),
     )
 
 
@@ -210,7 +214,11 @@ def save_config(config: TaskrConfig, config_path: Path | None = None) -> None:
     if config.database.type == "sqlite":
         data["database"]["sqlite"] = {"path": config.database.sqlite_path}
     elif config.database.postgres_url:
-        data["database"]["postgres"] = {"url": config.database.postgres_url}
+        data["database"]["postgres"] = {
+            "url": config.database.postgres_url,
+            "pool_min_size": config.database.postgres_pool_min,
+            "pool_max_size": config.database.postgres_pool_max,
+        }
 
     # Add identity
     if config.identity.author:
@@ -3,10 +3,11 @@ Database abstraction layer supporting PostgreSQL and SQLite.
 """
 
 from taskr.db.factory import get_adapter, init_adapter
-from taskr.db.interface import DatabaseAdapter
+from taskr.db.interface import DatabaseAdapter, status_rowcount
 
 __all__ = [
     "DatabaseAdapter",
     "get_adapter",
     "init_adapter",
+    "status_rowcount",
 ]
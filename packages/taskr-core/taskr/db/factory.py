@@ -51,7 +51,11 @@ def get_adapter(config=None) -> DatabaseAdapter:
                 "Set database.postgres.url in config or TASKR_DATABASE_URL env var."
             )
 
-        _adapter = PostgresAdapter(url)
+        _adapter = PostgresAdapter(
+            url,
+            min_size=config.database.postgres_pool_min,
+            max_size=config.database.postgres_pool_max,
+        )
         logger.info("Using PostgreSQL adapter")
 
     elif db_type == "sqlite":
@@ -4,8 +4,24 @@ Abstract database adapter interface.
 Supports both PostgreSQL and SQLite with feature detection for graceful degradation.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal
+
+# Matches PostgreSQL-style positional placeholders ($1, $2, ...)
+_DOLLAR_PLACEHOLDER_RE = re.compile(r"\$\d+")
+
+
+def status_rowcount(status: str) -> int:
+    """
+    Return the affected row count from an execute() status string.
+
+    Status strings end in the count ("UPDATE 3", "INSERT 0 1"); anything
+    without a trailing integer (e.g. "OK") counts as zero.
+    """
+    _, _, count = status.rpartition(" ")
+    return int(count) if count.isdigit() else 0
 
 
 class DatabaseAdapter(ABC):
@@ -42,6 +58,31 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    @abstractmethod
+    async def executemany(self, query: str, args: list[tuple]) -> None:
+        """
+        Execute a query once per parameter tuple in a single transaction.
+
+        Args:
+            query: SQL query with placeholders ($1, $2 for PG; ? for SQLite)
+            args: Sequence of parameter tuples, one per execution
+        """
+        pass
+
+    @abstractmethod
+    async def execute_script(self, sql: str) -> None:
+        """
+        Execute a multi-statement SQL script without parameters.
+
+        Used for migration files. The script is sent as-is, so semicolons
+        inside strings, triggers and $$-quoted bodies are handled by the
+        database rather than split client-side.
+
+        Args:
+            sql: One or more SQL statements
+        """
+        pass
+
     @abstractmethod
     async def fetch(self, query: str, *args) -> list[dict]:
         """
@@ -56,6 +97,41 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    async def fetch_records(self, query: str, *args) -> Sequence[Mapping]:
+        """
+        Fetch multiple rows as read-only mappings.
+
+        Like fetch(), but adapters may return their native row type (e.g.
+        asyncpg.Record) instead of copying each row into a dict. Rows
+        support row["column"] access only.
+
+        Args:
+            query: SQL SELECT query
+            *args: Query parameters
+
+        Returns:
+            Sequence of row mappings
+        """
+        return await self.fetch(query, *args)
+
+    async def fetch_limited(self, query: str, *args, max_rows: int) -> list[dict]:
+        """
+        Fetch at most max_rows rows of a read-only query.
+
+        Adapters that can stream (cursors) stop reading once max_rows rows
+        have arrived instead of materializing the full result.
+
+        Args:
+            query: SQL SELECT query
+            *args: Query parameters
+            max_rows: Maximum rows to return
+
+        Returns:
+            List of row dicts
+        """
+        rows = await self.fetch(query, *args)
+        return rows[:max_rows]
+
     @abstractmethod
     async def fetchrow(self, query: str, *args) -> dict | None:
         """
@@ -108,6 +184,16 @@ class DatabaseAdapter(ABC):
         """Does this adapter support native array columns?"""
         pass
 
+    @property
+    def supports_returning(self) -> bool:
+        """
+        Can writes return rows via RETURNING through fetchrow()?
+
+        Defaults to False; adapters that opt in must commit the write when
+        it is issued through fetchrow().
+        """
+        return False
+
     @property
     @abstractmethod
     def placeholder_style(self) -> str:
@@ -120,6 +206,12 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    @property
+    @abstractmethod
+    def kind(self) -> Literal["postgres", "sqlite"]:
+        """Name of the database backend, as reported by taskr_health."""
+        pass
+
     @abstractmethod
     async def search_text(
         self,
@@ -128,6 +220,7 @@ class DatabaseAdapter(ABC):
         columns: list[str],
         limit: int = 20,
         where_clause: str | None = None,
+        where_params: list | None = None,
     ) -> list[dict]:
         """
         Full-text search with graceful degradation.
@@ -140,7 +233,10 @@ class DatabaseAdapter(ABC):
             query: Search query string
             columns: Columns to search in
             limit: Maximum results
-            where_clause: Additional WHERE conditions (without WHERE keyword)
+            where_clause: Additional WHERE conditions (without WHERE keyword).
+                Use $1, $2, ... placeholders numbered from 1; the adapter
+                renumbers them after its own parameters.
+            where_params: Values for the where_clause placeholders
 
         Returns:
             List of matching rows, ordered by relevance
@@ -158,8 +254,7 @@ class DatabaseAdapter(ABC):
             return query
 
         # Convert $1, $2, etc. to ? for SQLite
-        import re
-        return re.sub(r'\$\d+', '?', query)
+        return _DOLLAR_PLACEHOLDER_RE.sub("?", query)
 
     async def ensure_schema(self) -> None:
         """
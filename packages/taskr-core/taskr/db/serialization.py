@@ -0,0 +1,47 @@
+"""
+JSON helpers shared by the database adapters and services.
+
+Uses orjson when installed (pip install taskr-core[fast]) and falls back
+to the standard library otherwise. Both paths produce strings.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a Python value to a JSON string."""
+    if HAS_ORJSON:
+        try:
+            # Non-str keys are stringified like the stdlib does
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. ints wider than 64 bits, which the stdlib handles
+            pass
+    return json.dumps(value)
+
+
+def json_loads(value: str | bytes | None) -> Any:
+    """Deserialize a JSON string to a Python value (None stays None)."""
+    if value is None:
+        return None
+    if HAS_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def jsonb_encode(value: Any) -> str:
+    """
+    Encode a value for a PostgreSQL jsonb parameter.
+
+    Every value is encoded, so a str is stored as a JSON string; pass
+    dicts and lists, not json.dumps() output.
+    """
+    return json_dumps(value)
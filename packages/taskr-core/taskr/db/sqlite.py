@@ -8,12 +8,12 @@ Provides graceful degradation for features not available in SQLite:
 - Vector embeddings: Not supported
 """
 
-import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from taskr.db.interface import DatabaseAdapter
+from taskr.db.serialization import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +101,24 @@ class SQLiteAdapter(DatabaseAdapter):
             return f"DELETE {cursor.rowcount}"
         return "OK"
 
+    async def executemany(self, query: str, args: list[tuple]) -> None:
+        """Execute query for each parameter tuple and commit once."""
+        conn = await self._get_conn()
+        query = self.format_query(query)
+
+        try:
+            await conn.executemany(query, args)
+        except Exception:
+            await conn.rollback()
+            raise
+        await conn.commit()
+
+    async def execute_script(self, sql: str) -> None:
+        """Execute a multi-statement script via executescript()."""
+        conn = await self._get_conn()
+        await conn.executescript(sql)
+        await conn.commit()
+
     async def fetch(self, query: str, *args) -> list[dict]:
         """Fetch rows as list of dicts."""
         conn = await self._get_conn()
@@ -112,6 +130,17 @@ class SQLiteAdapter(DatabaseAdapter):
         # Convert Row objects to dicts
         return [dict(row) for row in rows]
 
+    async def fetch_limited(self, query: str, *args, max_rows: int) -> list[dict]:
+        """Fetch up to max_rows rows without reading the rest of the result."""
+        conn = await self._get_conn()
+        query = self.format_query(query)
+
+        cursor = await conn.execute(query, args)
+        rows = await cursor.fetchmany(max_rows)
+        await cursor.close()
+
+        return [dict(row) for row in rows]
+
     async def fetchrow(self, query: str, *args) -> dict | None:
         """Fetch single row as dict."""
         conn = await self._get_conn()
@@ -160,6 +189,11 @@ class SQLiteAdapter(DatabaseAdapter):
         """SQLite uses ? style placeholders."""
         return "qmark"
 
+    @property
+    def kind(self) -> Literal["postgres", "sqlite"]:
+        """This adapter talks to SQLite."""
+        return "sqlite"
+
     async def search_text(
         self,
         table: str,
@@ -167,6 +201,7 @@ class SQLiteAdapter(DatabaseAdapter):
         columns: list[str],
         limit: int = 20,
         where_clause: str | None = None,
+        where_params: list | None = None,
     ) -> list[dict]:
         """
         Text search using LIKE wildcards.
@@ -185,6 +220,7 @@ class SQLiteAdapter(DatabaseAdapter):
             # Convert PostgreSQL placeholders in where_clause
             where_clause = self.format_query(where_clause)
             where_parts.append(f"({where_clause})")
+            params.extend(where_params or [])
 
         where_sql = " AND ".join(where_parts)
 
@@ -202,25 +238,13 @@ class SQLiteAdapter(DatabaseAdapter):
 
 # Utility functions for SQLite-specific operations
 
-def json_dumps(value: Any) -> str:
-    """Serialize Python value to JSON string for SQLite storage."""
-    return json.dumps(value)
-
-
-def json_loads(value: str) -> Any:
-    """Deserialize JSON string from SQLite to Python value."""
-    if value is None:
-        return None
-    return json.loads(value)
-
-
 def list_to_json(items: list[str]) -> str:
     """Convert Python list to JSON string for SQLite storage."""
-    return json.dumps(items or [])
+    return json_dumps(items or [])
 
 
 def json_to_list(value: str) -> list[str]:
     """Convert JSON string from SQLite to Python list."""
     if value is None:
         return []
-    return json.loads(value)
+    return json_loads(value)
@@ -5,13 +5,14 @@ Devlogs are development log entries that serve as AI memory -
 capturing decisions, patterns, bugfixes, and other knowledge.
 """
 
+import copy
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-# Valid devlog categories
-DEVLOG_CATEGORIES = (
+# Valid devlog categories, in display order
+DEVLOG_CATEGORIES_TUPLE = (
     "feature",     # New feature implementation
     "bugfix",      # Bug fix
     "deployment",  # Deployment notes
@@ -24,6 +25,17 @@ DEVLOG_CATEGORIES = (
     "note",        # General note
 )
 
+# Set form for O(1) membership checks
+DEVLOG_CATEGORIES = frozenset(DEVLOG_CATEGORIES_TUPLE)
+
+
+def invalid_category_error(category: str) -> ValueError:
+    """Build the error raised for an unknown devlog category."""
+    return ValueError(
+        f"Invalid category '{category}'. "
+        f"Must be one of: {', '.join(DEVLOG_CATEGORIES_TUPLE)}"
+    )
+
 
 @dataclass
 class Devlog:
@@ -66,16 +78,13 @@ class Devlog:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.utcnow()
+            self.created_at = datetime.now(timezone.utc)
         if self.updated_at is None:
             self.updated_at = self.created_at
 
         # Validate category
         if self.category not in DEVLOG_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{self.category}'. "
-                f"Must be one of: {', '.join(DEVLOG_CATEGORIES)}"
-            )
+            raise invalid_category_error(self.category)
 
     @property
     def is_deleted(self) -> bool:
@@ -101,23 +110,32 @@ class Devlog:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Devlog":
-        """Create Devlog from dictionary (e.g., database row)."""
-        import json
+        """
+        Create Devlog from dictionary (e.g., database row).
+
+        data is left untouched and the Devlog gets its own tags and
+        metadata, so one cached row can build any number of Devlogs.
+        """
+        from taskr.db.serialization import json_loads
 
         # Parse datetime fields
+        timestamps = {}
         for field_name in ("created_at", "updated_at", "deleted_at"):
-            if data.get(field_name) and isinstance(data[field_name], str):
-                data[field_name] = datetime.fromisoformat(data[field_name].replace("Z", "+00:00"))
+            value = data.get(field_name)
+            if value and isinstance(value, str):
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            timestamps[field_name] = value
 
-        # Handle tags (may be JSON string in SQLite)
+        # Handle tags (JSON string in SQLite, a list in PostgreSQL)
         tags = data.get("tags", [])
-        if isinstance(tags, str):
-            tags = json.loads(tags)
+        tags = json_loads(tags) if isinstance(tags, str) else list(tags or [])
 
-        # Handle metadata (may be JSON string in SQLite)
+        # Handle metadata (JSON string in SQLite, a dict in PostgreSQL)
         metadata = data.get("metadata", {})
         if isinstance(metadata, str):
-            metadata = json.loads(metadata)
+            metadata = json_loads(metadata)
+        else:
+            metadata = copy.deepcopy(metadata) if metadata else {}
 
         return cls(
             id=data.get("id"),
@@ -129,9 +147,7 @@ class Devlog:
             service_name=data.get("service_name"),
             tags=tags,
             metadata=metadata,
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at"),
-            deleted_at=data.get("deleted_at"),
+            **timestamps,
         )
 
     def summary(self, max_length: int = 100) -> str:
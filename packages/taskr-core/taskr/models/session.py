@@ -6,7 +6,7 @@ Activities log specific actions within sessions.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import uuid4
 
 
@@ -43,7 +43,7 @@ class Session:
     updated_at: datetime | None = None
 
     def __post_init__(self):
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         if self.started_at is None:
             self.started_at = now
         if self.created_at is None:
@@ -61,8 +61,14 @@ class Session:
         """Get session duration in seconds."""
         if not self.started_at:
             return None
-        end = self.ended_at or datetime.utcnow()
-        return (end - self.started_at).total_seconds()
+        start = self.started_at
+        end = self.ended_at or datetime.now(timezone.utc)
+        # Rows written before timestamps were tz-aware are naive UTC
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        return (end - start).total_seconds()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage/serialization."""
@@ -153,7 +159,7 @@ class Activity:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.utcnow()
+            self.created_at = datetime.now(timezone.utc)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage/serialization."""
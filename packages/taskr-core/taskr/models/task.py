@@ -4,12 +4,22 @@ Task model for Taskr.
 Tasks are the core work items that can be created, assigned, and tracked.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import uuid4
 
+_DATETIME_FIELDS = ("created_at", "updated_at", "due_at", "completed_at", "deleted_at")
 
-@dataclass
+
+def _parse_datetime(value):
+    """Parse ISO strings (SQLite) and pass datetimes (PostgreSQL) through."""
+    if value and isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+@dataclass(slots=True)
 class Task:
     """
     A task or work item.
@@ -46,7 +56,7 @@ class Task:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.utcnow()
+            self.created_at = datetime.now(timezone.utc)
         if self.updated_at is None:
             self.updated_at = self.created_at
 
@@ -87,14 +97,14 @@ class Task:
     def from_dict(cls, data: dict) -> "Task":
         """Create Task from dictionary (e.g., database row)."""
         # Parse datetime fields
-        for field_name in ("created_at", "updated_at", "due_at", "completed_at", "deleted_at"):
+        for field_name in _DATETIME_FIELDS:
             if data.get(field_name) and isinstance(data[field_name], str):
-                data[field_name] = datetime.fromisoformat(data[field_name].replace("Z", "+00:00"))
+                data[field_name] = _parse_datetime(data[field_name])
 
         # Handle tags (may be JSON string in SQLite)
         if isinstance(data.get("tags"), str):
-            import json
-            data["tags"] = json.loads(data["tags"])
+            from taskr.db.serialization import json_loads
+            data["tags"] = json_loads(data["tags"])
 
         return cls(
             id=data.get("id"),
@@ -112,6 +122,36 @@ class Task:
             deleted_at=data.get("deleted_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: Mapping) -> "Task":
+        """
+        Create Task from a full database row.
+
+        Faster than from_dict for rows read from the tasks table: skips
+        __init__/__post_init__ and neither mutates nor aliases the row, so
+        cached rows can be reused. Expects every task column to be present.
+        """
+        tags = row["tags"]
+        if isinstance(tags, str):
+            from taskr.db.serialization import json_loads
+            tags = json_loads(tags)
+
+        task = cls.__new__(cls)
+        task.id = row["id"]
+        task.title = row["title"]
+        task.description = row["description"]
+        task.status = row["status"]
+        task.priority = row["priority"]
+        task.assignee = row["assignee"]
+        task.tags = list(tags) if tags is not None else []
+        task.created_by = row["created_by"]
+        task.created_at = _parse_datetime(row["created_at"])
+        task.updated_at = _parse_datetime(row["updated_at"])
+        task.due_at = _parse_datetime(row["due_at"])
+        task.completed_at = _parse_datetime(row["completed_at"])
+        task.deleted_at = _parse_datetime(row["deleted_at"])
+        return task
+
 
 # Valid status values
 TASK_STATUSES = ("open", "in_progress", "done", "cancelled")
@@ -18,7 +18,8 @@ class PluginInfo:
     Plugin metadata.
 
     Attributes:
-        name: Unique plugin name (used in config)
+        name: Unique plugin name (used in config; must match the
+              'taskr.plugins' entry point name)
         version: Semantic version string
         description: Human-readable description
         requires_postgres: True if plugin needs PostgreSQL-only features
@@ -4,17 +4,62 @@ Devlog Service for Taskr.
 Development logs for AI agent memory and institutional knowledge.
 """
 
+import asyncio
 import builtins
-import json
 import logging
-from datetime import datetime
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any
 
-from taskr.db import get_adapter
-from taskr.models.devlog import DEVLOG_CATEGORIES, Devlog
+from taskr.cache import TTLCache
+from taskr.db import get_adapter, status_rowcount
+from taskr.db.serialization import json_dumps
+from taskr.models.devlog import (
+    DEVLOG_CATEGORIES,
+    DEVLOG_CATEGORIES_TUPLE,
+    Devlog,
+    invalid_category_error,
+)
 
 logger = logging.getLogger(__name__)
 
+# Keys accepted by DevlogService.add_many items
+_DEVLOG_ITEM_FIELDS = frozenset({
+    "category", "title", "content", "author",
+    "agent_id", "service_name", "tags", "metadata",
+})
+
+
+def _devlog_from_item(index: int, item: dict) -> Devlog:
+    """Validate one add_many item and build its Devlog."""
+    if not isinstance(item, dict):
+        raise ValueError(f"Devlog {index}: expected an object, got {type(item).__name__}")
+
+    unknown = item.keys() - _DEVLOG_ITEM_FIELDS
+    if unknown:
+        raise ValueError(f"Devlog {index}: unknown fields: {', '.join(sorted(unknown))}")
+
+    for key in ("title", "content"):
+        if not isinstance(item.get(key), str):
+            raise ValueError(f"Devlog {index}: {key} is required")
+
+    try:
+        # Devlog validates the category on construction
+        return Devlog(
+            category=item.get("category"),
+            title=item["title"],
+            content=item["content"],
+            author=item.get("author"),
+            agent_id=item.get("agent_id") or "claude-code",
+            service_name=item.get("service_name"),
+            tags=item.get("tags") or [],
+            metadata=item.get("metadata") or {},
+        )
+    except ValueError as e:
+        raise ValueError(f"Devlog {index}: {e}") from None
+
 
 class DevlogService:
     """
@@ -36,6 +81,20 @@ class DevlogService:
         """
         self._adapter = adapter
 
+        # Search results change on the order of minutes, so repeated
+        # searches within a session are answered from memory. Rows are
+        # cached so every hit builds fresh Devlog objects; local writes
+        # clear the cache.
+        self._search_cache = TTLCache(maxsize=512, ttl=60.0)
+        # Identical concurrent searches share one in-flight query
+        self._search_inflight: dict[tuple, asyncio.Task] = {}
+
+    def _invalidate_search(self) -> None:
+        """Drop cached and in-flight search results after a write."""
+        self._search_cache.clear()
+        # Queries already running keep their callers but are not cached
+        self._search_inflight.clear()
+
     @property
     def adapter(self):
         """Get the database adapter."""
@@ -49,6 +108,46 @@ class DevlogService:
             return "taskr.devlogs"
         return "devlogs"  # SQLite
 
+    @cached_property
+    def _get_sql(self) -> str:
+        """SELECT-by-id statement, formatted once for this adapter."""
+        return sys.intern(self.adapter.format_query(
+            f"SELECT * FROM {self._table_name()} WHERE id = $1 AND deleted_at IS NULL"
+        ))
+
+    @cached_property
+    def _insert_sql(self) -> str:
+        """INSERT statement, formatted once for this adapter."""
+        metadata = "$9::jsonb" if self.adapter.placeholder_style == "dollar" else "$9"
+        return sys.intern(self.adapter.format_query(
+            f"INSERT INTO {self._table_name()} "
+            "(id, category, title, content, author, agent_id, service_name, tags, metadata, "
+            "created_at, updated_at) "
+            f"VALUES ($1, $2, $3, $4, $5, $6, $7, $8, {metadata}, $10, $11)"
+        ))
+
+    def _insert_args(self, devlog: Devlog) -> tuple:
+        """Parameters for _insert_sql, encoded for this adapter."""
+        tags_value = json_dumps(devlog.tags) if not self.adapter.supports_arrays else devlog.tags
+        metadata_value = json_dumps(devlog.metadata) if not self.adapter.supports_jsonb else devlog.metadata
+        created_at, updated_at = devlog.created_at, devlog.updated_at
+        if self.adapter.placeholder_style != "dollar":
+            created_at = created_at.isoformat() if created_at else None
+            updated_at = updated_at.isoformat() if updated_at else None
+
+        return (
+            devlog.id, devlog.category, devlog.title, devlog.content,
+            devlog.author, devlog.agent_id, devlog.service_name,
+            tags_value, metadata_value, created_at, updated_at,
+        )
+
+    @cached_property
+    def _delete_sql(self) -> str:
+        """Soft-delete statement, formatted once for this adapter."""
+        return sys.intern(self.adapter.format_query(
+            f"UPDATE {self._table_name()} SET deleted_at = $1 WHERE id = $2 AND deleted_at IS NULL"
+        ))
+
     async def add(
         self,
         category: str,
@@ -76,12 +175,7 @@ class DevlogService:
         Returns:
             Created Devlog object
         """
-        if category not in DEVLOG_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{category}'. "
-                f"Must be one of: {', '.join(DEVLOG_CATEGORIES)}"
-            )
-
+        # Devlog validates the category on construction
         devlog = Devlog(
             category=category,
             title=title,
@@ -93,46 +187,40 @@ class DevlogService:
             metadata=metadata or {},
         )
 
-        table = self._table_name()
-        tags_value = json.dumps(devlog.tags) if not self.adapter.supports_arrays else devlog.tags
-        metadata_value = json.dumps(devlog.metadata)
+        await self.adapter.execute(self._insert_sql, *self._insert_args(devlog))
 
-        if self.adapter.placeholder_style == "dollar":
-            await self.adapter.execute(
-                f"""
-                INSERT INTO {table}
-                    (id, category, title, content, author, agent_id, service_name, tags, metadata, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9::jsonb, $10, $11)
-                """,
-                devlog.id, devlog.category, devlog.title, devlog.content,
-                devlog.author, devlog.agent_id, devlog.service_name,
-                tags_value, metadata_value,
-                devlog.created_at, devlog.updated_at,
-            )
-        else:
-            await self.adapter.execute(
-                f"""
-                INSERT INTO {table}
-                    (id, category, title, content, author, agent_id, service_name, tags, metadata, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                devlog.id, devlog.category, devlog.title, devlog.content,
-                devlog.author, devlog.agent_id, devlog.service_name,
-                tags_value, metadata_value,
-                devlog.created_at.isoformat() if devlog.created_at else None,
-                devlog.updated_at.isoformat() if devlog.updated_at else None,
-            )
-
-        logger.info(f"Created devlog: {devlog.id} [{devlog.category}] {devlog.title}")
+        self._invalidate_search()
+        logger.info("Created devlog: %s [%s] %s", devlog.id, devlog.category, devlog.title)
         return devlog
 
+    async def add_many(self, items: builtins.list[dict]) -> builtins.list[Devlog]:
+        """
+        Create several devlog entries in a single batched INSERT.
+
+        Args:
+            items: Devlog field dicts accepting the same keys as add()
+
+        Returns:
+            Created Devlog objects, in input order
+
+        Raises:
+            ValueError: If any item is invalid (nothing is inserted)
+        """
+        devlogs = [_devlog_from_item(index, item) for index, item in enumerate(items)]
+        if not devlogs:
+            return []
+
+        await self.adapter.executemany(
+            self._insert_sql, [self._insert_args(devlog) for devlog in devlogs]
+        )
+        self._invalidate_search()
+
+        logger.info("Created %d devlogs", len(devlogs))
+        return devlogs
+
     async def get(self, devlog_id: str) -> Devlog | None:
         """Get a devlog by ID."""
-        table = self._table_name()
-        query = self.adapter.format_query(
-            f"SELECT * FROM {table} WHERE id = $1 AND deleted_at IS NULL"
-        )
-        row = await self.adapter.fetchrow(query, devlog_id)
+        row = await self.adapter.fetchrow(self._get_sql, devlog_id)
         if row:
             return Devlog.from_dict(row)
         return None
@@ -161,10 +249,7 @@ class DevlogService:
             Updated Devlog or None if not found
         """
         if category and category not in DEVLOG_CATEGORIES:
-            raise ValueError(
-                f"Invalid category '{category}'. "
-                f"Must be one of: {', '.join(DEVLOG_CATEGORIES)}"
-            )
+            raise invalid_category_error(category)
 
         # Build dynamic update
         updates = []
@@ -184,18 +269,18 @@ class DevlogService:
 
         if tags is not None:
             updates.append("tags")
-            params.append(json.dumps(tags) if not self.adapter.supports_arrays else tags)
+            params.append(json_dumps(tags) if not self.adapter.supports_arrays else tags)
 
         if metadata is not None:
             updates.append("metadata")
-            params.append(json.dumps(metadata))
+            params.append(json_dumps(metadata) if not self.adapter.supports_jsonb else metadata)
 
         if not updates:
             return await self.get(devlog_id)
 
         # Add updated_at
         updates.append("updated_at")
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         params.append(now.isoformat() if self.adapter.placeholder_style == "qmark" else now)
 
         table = self._table_name()
@@ -219,25 +304,20 @@ class DevlogService:
             """
 
         await self.adapter.execute(query, *params)
+        self._invalidate_search()
         return await self.get(devlog_id)
 
     async def delete(self, devlog_id: str) -> bool:
         """Soft delete a devlog entry."""
-        table = self._table_name()
-        now = datetime.utcnow()
-
-        if self.adapter.placeholder_style == "dollar":
-            result = await self.adapter.execute(
-                f"UPDATE {table} SET deleted_at = $1 WHERE id = $2 AND deleted_at IS NULL",
-                now, devlog_id,
-            )
-        else:
-            result = await self.adapter.execute(
-                f"UPDATE {table} SET deleted_at = ? WHERE id = ? AND deleted_at IS NULL",
-                now.isoformat(), devlog_id,
-            )
+        now = datetime.now(timezone.utc)
+        result = await self.adapter.execute(
+            self._delete_sql,
+            now if self.adapter.placeholder_style == "dollar" else now.isoformat(),
+            devlog_id,
+        )
 
-        return "1" in result
+        self._invalidate_search()
+        return status_rowcount(result) > 0
 
     async def list(
         self,
@@ -269,7 +349,7 @@ class DevlogService:
 
         if category:
             if category not in DEVLOG_CATEGORIES:
-                raise ValueError(f"Invalid category '{category}'")
+                raise invalid_category_error(category)
             conditions.append(f"category = ${len(params)+1}" if self.adapter.placeholder_style == "dollar" else "category = ?")
             params.append(category)
 
@@ -291,11 +371,11 @@ class DevlogService:
             params.append(tags)
         elif tags:
             # SQLite: check if any tag is in the JSON array
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append(f"tags LIKE '%\"{tag}\"%'")
-            if tag_conditions:
-                conditions.append(f"({' OR '.join(tag_conditions)})")
+            placeholders = ", ".join("?" * len(tags))
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM json_each(tags) WHERE value IN ({placeholders}))"
+            )
+            params.extend(tags)
 
         table = self._table_name()
         where_clause = " AND ".join(conditions)
@@ -322,7 +402,7 @@ class DevlogService:
     async def search(
         self,
         query: str,
-        category: str | None = None,
+        category: str | Sequence[str] | None = None,
         service_name: str | None = None,
         limit: int = 20,
     ) -> builtins.list[Devlog]:
@@ -334,33 +414,75 @@ class DevlogService:
 
         Args:
             query: Search query
-            category: Optional category filter
+            category: Optional category filter; a list matches any of the
+                      categories in a single query
             service_name: Optional service filter
             limit: Max results
 
         Returns:
             List of Devlog objects ranked by relevance
         """
+        if category is not None and not isinstance(category, str):
+            category = tuple(category)
+        key = (query, category, service_name, limit)
+        rows = self._search_cache.get(key)
+        if rows is None:
+            task = self._search_inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._search_rows(query, category, service_name, limit)
+                )
+                self._search_inflight[key] = task
+                task.add_done_callback(lambda t: self._finish_search(key, t))
+            # Shield so one caller being cancelled doesn't cancel the others
+            rows = await asyncio.shield(task)
+        return [Devlog.from_dict(row) for row in rows]
+
+    def _finish_search(self, key: tuple, task: asyncio.Task) -> None:
+        """Cache a finished search unless a write invalidated it meanwhile."""
+        if self._search_inflight.get(key) is not task:
+            return
+        del self._search_inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._search_cache.set(key, task.result())
+
+    async def _search_rows(
+        self,
+        query: str,
+        category: str | tuple[str, ...] | None,
+        service_name: str | None,
+        limit: int,
+    ) -> builtins.list[dict]:
+        """Run the full-text search query and return raw rows."""
         table = self._table_name()
 
         # Build additional where clause
         where_parts = []
-        if category:
-            where_parts.append(f"category = '{category}'")
+        where_params = []
+        if isinstance(category, str):
+            where_params.append(category)
+            where_parts.append(f"category = ${len(where_params)}")
+        elif category:
+            placeholders = []
+            for value in category:
+                where_params.append(value)
+                placeholders.append(f"${len(where_params)}")
+            where_parts.append(f"category IN ({', '.join(placeholders)})")
         if service_name:
-            where_parts.append(f"service_name = '{service_name}'")
+            where_params.append(service_name)
+            where_parts.append(f"service_name = ${len(where_params)}")
 
         where_clause = " AND ".join(where_parts) if where_parts else None
 
-        rows = await self.adapter.search_text(
+        return await self.adapter.search_text(
             table=table,
             query=query,
             columns=["title", "content"],
             limit=limit,
             where_clause=where_clause,
+            where_params=where_params,
         )
-        return [Devlog.from_dict(row) for row in rows]
 
     def get_categories(self) -> builtins.list[str]:
         """Get list of valid categories."""
-        return list(DEVLOG_CATEGORIES)
+        return list(DEVLOG_CATEGORIES_TUPLE)
@@ -5,7 +5,7 @@ Agent session management with work claiming and handoff support.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 from taskr.db import get_adapter
@@ -117,7 +117,7 @@ class SessionService:
                 session.updated_at.isoformat() if session.updated_at else None,
             )
 
-        logger.info(f"Started session: {session.id} for agent {agent_id}")
+        logger.info("Started session: %s for agent %s", session.id, agent_id)
 
         return {
             "session_id": session.id,
@@ -145,7 +145,7 @@ class SessionService:
         Returns:
             Dict with session end confirmation and duration
         """
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         sessions_table = self._sessions_table()
 
         # Update session
@@ -181,9 +181,12 @@ class SessionService:
             started = session["started_at"]
             if isinstance(started, str):
                 started = datetime.fromisoformat(started.replace("Z", "+00:00"))
+            if started.tzinfo is None:
+                # Rows written before timestamps were tz-aware are naive UTC
+                started = started.replace(tzinfo=timezone.utc)
             duration_seconds = (now - started).total_seconds()
 
-        logger.info(f"Ended session: {session_id}")
+        logger.info("Ended session: %s", session_id)
 
         return {
             "session_id": session_id,
@@ -277,7 +280,7 @@ class SessionService:
                 activity.repo, activity.created_at.isoformat() if activity.created_at else None,
             )
 
-        logger.info(f"Agent {agent_id} claimed work: {target_id}")
+        logger.info("Agent %s claimed work: %s", agent_id, target_id)
 
         return {
             "claimed": True,
@@ -346,7 +349,7 @@ class SessionService:
                 activity.repo, activity.notes, activity.created_at.isoformat() if activity.created_at else None,
             )
 
-        logger.info(f"Agent {agent_id} released work: {target_id} [{status}]")
+        logger.info("Agent %s released work: %s [%s]", agent_id, target_id, status)
 
         return {
             "released": True,
@@ -5,15 +5,110 @@ CRUD operations for tasks with support for both PostgreSQL and SQLite.
 """
 
 import builtins
-import json
 import logging
-from datetime import datetime
-
-from taskr.db import get_adapter
+import sys
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from typing import Any
+
+from taskr.cache import TTLCache
+from taskr.db import get_adapter, status_rowcount
+from taskr.db.serialization import json_dumps, json_loads
 from taskr.models.task import TASK_PRIORITIES, TASK_STATUSES, Task
 
 logger = logging.getLogger(__name__)
 
+# Pre-rendered positional placeholders, indexed from 0 ("$1" / "?")
+_DOLLAR = tuple(f"${i}" for i in range(1, 65))
+_QMARK = ("?",) * 64
+
+_INSERT_COLUMNS = (
+    "id, title, description, status, priority, assignee, tags, created_by, "
+    "due_at, created_at, updated_at"
+)
+_INSERT_VALUES = ", ".join(_DOLLAR[:11])
+
+# Columns returned to callers, in Task.to_dict() order
+_TASK_COLUMNS = (
+    "id", "title", "description", "status", "priority", "assignee", "tags",
+    "created_by", "created_at", "updated_at", "due_at", "completed_at", "deleted_at",
+)
+_TASK_DATETIME_COLUMNS = ("created_at", "updated_at", "due_at", "completed_at", "deleted_at")
+_SELECT_COLUMNS = ", ".join(_TASK_COLUMNS)
+
+
+@lru_cache(maxsize=128)
+def _update_sql(
+    table: str,
+    columns: tuple[str, ...],
+    placeholder_style: str,
+    returning: bool = False,
+) -> str:
+    """Build the UPDATE statement for a set of columns, cached per shape."""
+    ph = _DOLLAR if placeholder_style == "dollar" else _QMARK
+    set_clause = ", ".join([f"{col} = {ph[i]}" for i, col in enumerate(columns)])
+    id_placeholder = ph[len(columns)]
+    suffix = " RETURNING " + _SELECT_COLUMNS if returning else ""
+    return sys.intern(
+        f"UPDATE {table} SET {set_clause} WHERE id = {id_placeholder} AND deleted_at IS NULL{suffix}"
+    )
+
+
+# Keys accepted by TaskService.create_many items
+_TASK_ITEM_FIELDS = frozenset({
+    "title", "description", "status", "priority",
+    "assignee", "tags", "created_by", "due_at",
+})
+
+
+def _task_from_item(index: int, item: dict, created_by: str | None, now: datetime) -> Task:
+    """Validate one create_many item and build its Task."""
+    if not isinstance(item, dict):
+        raise ValueError(f"Task {index}: expected an object, got {type(item).__name__}")
+
+    unknown = item.keys() - _TASK_ITEM_FIELDS
+    if unknown:
+        raise ValueError(f"Task {index}: unknown fields: {', '.join(sorted(unknown))}")
+
+    title = item.get("title")
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError(f"Task {index}: title is required")
+
+    status = item.get("status", "open")
+    priority = item.get("priority", "medium")
+    if status not in TASK_STATUSES:
+        raise ValueError(f"Task {index}: invalid status. Must be one of: {', '.join(TASK_STATUSES)}")
+    if priority not in TASK_PRIORITIES:
+        raise ValueError(f"Task {index}: invalid priority. Must be one of: {', '.join(TASK_PRIORITIES)}")
+
+    tags = item.get("tags") or []
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise ValueError(f"Task {index}: tags must be a list of strings")
+
+    due_at = item.get("due_at")
+    if isinstance(due_at, str):
+        try:
+            due_at = datetime.fromisoformat(due_at.replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError(f"Task {index}: due_at must be an ISO 8601 datetime") from None
+    elif due_at is not None and not isinstance(due_at, datetime):
+        raise ValueError(f"Task {index}: due_at must be an ISO 8601 datetime")
+    if due_at is not None and due_at.tzinfo is None:
+        due_at = due_at.replace(tzinfo=timezone.utc)
+
+    return Task(
+        title=title,
+        description=item.get("description"),
+        status=status,
+        priority=priority,
+        assignee=item.get("assignee"),
+        tags=tags,
+        created_by=item.get("created_by", created_by),
+        due_at=due_at,
+        created_at=now,
+    )
+
 
 class TaskService:
     """
@@ -31,6 +126,20 @@ class TaskService:
         """
         self._adapter = adapter
 
+        # Hot read caches. Rows are cached (not Task objects) so every hit
+        # builds a fresh Task. TTLs bound staleness from other writers
+        # sharing the database; local writes invalidate immediately.
+        self._task_cache = TTLCache(maxsize=1024, ttl=5.0)
+        self._list_cache = TTLCache(maxsize=64, ttl=2.0)
+        self._generation = 0
+
+    def _invalidate(self, task_id: str | None = None) -> None:
+        """Drop cached reads affected by a write."""
+        # List keys embed the generation, so stale pages simply age out
+        self._generation += 1
+        if task_id is not None:
+            self._task_cache.pop(task_id)
+
     @property
     def adapter(self):
         """Get the database adapter."""
@@ -38,11 +147,49 @@ class TaskService:
             self._adapter = get_adapter()
         return self._adapter
 
-    def _table_name(self) -> str:
-        """Get the full table name."""
-        if self.adapter.supports_fts:  # PostgreSQL
-            return "taskr.tasks"
-        return "tasks"  # SQLite
+    # Adapter traits are fixed for the life of the service, so resolve
+    # them once instead of going through the adapter property per call.
+
+    @cached_property
+    def _ph(self) -> str:
+        """Placeholder style of the adapter."""
+        return self.adapter.placeholder_style
+
+    @cached_property
+    def _arrays(self) -> bool:
+        """Whether the adapter stores tags as native arrays."""
+        return self.adapter.supports_arrays
+
+    @cached_property
+    def _fts(self) -> bool:
+        """Whether the adapter is PostgreSQL (full-text search)."""
+        return self.adapter.supports_fts
+
+    @cached_property
+    def _table(self) -> str:
+        """Full table name."""
+        return "taskr.tasks" if self._fts else "tasks"
+
+    @cached_property
+    def _insert_sql(self) -> str:
+        """INSERT statement, formatted once for this adapter."""
+        return sys.intern(self.adapter.format_query(
+            f"INSERT INTO {self._table} ({_INSERT_COLUMNS}) VALUES ({_INSERT_VALUES})"
+        ))
+
+    @cached_property
+    def _get_sql(self) -> str:
+        """SELECT-by-id statement, formatted once for this adapter."""
+        return sys.intern(self.adapter.format_query(
+            f"SELECT {_SELECT_COLUMNS} FROM {self._table} WHERE id = $1 AND deleted_at IS NULL"
+        ))
+
+    @cached_property
+    def _delete_sql(self) -> str:
+        """Soft-delete statement, formatted once for this adapter."""
+        return sys.intern(self.adapter.format_query(
+            f"UPDATE {self._table} SET deleted_at = $1 WHERE id = $2 AND deleted_at IS NULL"
+        ))
 
     async def create(
         self,
@@ -87,47 +234,93 @@ class TaskService:
             due_at=due_at,
         )
 
-        table = self._table_name()
-        tags_value = json.dumps(task.tags) if not self.adapter.supports_arrays else task.tags
+        tags_value = json_dumps(task.tags) if not self._arrays else task.tags
 
-        if self.adapter.placeholder_style == "dollar":
+        if self._ph == "dollar":
             await self.adapter.execute(
-                f"""
-                INSERT INTO {table}
-                    (id, title, description, status, priority, assignee, tags, created_by, due_at, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                """,
+                self._insert_sql,
                 task.id, task.title, task.description, task.status, task.priority,
                 task.assignee, tags_value, task.created_by,
                 task.due_at, task.created_at, task.updated_at,
             )
         else:
+            # created_at == updated_at on a fresh task
+            created_iso = task.created_at.isoformat()
             await self.adapter.execute(
-                f"""
-                INSERT INTO {table}
-                    (id, title, description, status, priority, assignee, tags, created_by, due_at, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                self._insert_sql,
                 task.id, task.title, task.description, task.status, task.priority,
                 task.assignee, tags_value, task.created_by,
                 task.due_at.isoformat() if task.due_at else None,
-                task.created_at.isoformat() if task.created_at else None,
-                task.updated_at.isoformat() if task.updated_at else None,
+                created_iso, created_iso,
             )
 
+        self._invalidate()
         logger.info(f"Created task: {task.id} - {task.title}")
         return task
 
+    async def create_many(
+        self,
+        items: builtins.list[dict],
+        created_by: str | None = None,
+    ) -> builtins.list[Task]:
+        """
+        Create several tasks in a single batched INSERT.
+
+        Args:
+            items: Task field dicts accepting the same keys as create().
+                   due_at may be a datetime or an ISO 8601 string.
+            created_by: Default creator for items that don't set one
+
+        Returns:
+            Created Task objects, in input order
+
+        Raises:
+            ValueError: If any item is invalid (nothing is inserted)
+        """
+        now = datetime.now(timezone.utc)
+        tasks = [
+            _task_from_item(index, item, created_by, now)
+            for index, item in enumerate(items)
+        ]
+
+        if not tasks:
+            return []
+
+        if self._ph == "dollar":
+            rows = [
+                (t.id, t.title, t.description, t.status, t.priority,
+                 t.assignee, t.tags if self._arrays else json_dumps(t.tags), t.created_by,
+                 t.due_at, t.created_at, t.updated_at)
+                for t in tasks
+            ]
+        else:
+            now_iso = now.isoformat()
+            rows = [
+                (t.id, t.title, t.description, t.status, t.priority,
+                 t.assignee, t.tags if self._arrays else json_dumps(t.tags), t.created_by,
+                 t.due_at.isoformat() if t.due_at else None,
+                 now_iso, now_iso)
+                for t in tasks
+            ]
+
+        await self.adapter.executemany(self._insert_sql, rows)
+        self._invalidate()
+
+        logger.info("Created %d tasks", len(tasks))
+        return tasks
+
     async def get(self, task_id: str) -> Task | None:
         """Get a task by ID."""
-        table = self._table_name()
-        query = self.adapter.format_query(
-            f"SELECT * FROM {table} WHERE id = $1 AND deleted_at IS NULL"
-        )
-        row = await self.adapter.fetchrow(query, task_id)
-        if row:
-            return Task.from_dict(row)
-        return None
+        row = self._task_cache.get(task_id)
+        if row is None:
+            generation = self._generation
+            row = await self.adapter.fetchrow(self._get_sql, task_id)
+            if row is None:
+                return None
+            # A write that finished while we were fetching makes this row stale
+            if self._generation == generation:
+                self._task_cache.set(task_id, row)
+        return Task.from_row(row)
 
     async def update(
         self,
@@ -161,88 +354,74 @@ class TaskService:
         if priority and priority not in TASK_PRIORITIES:
             raise ValueError(f"Invalid priority. Must be one of: {', '.join(TASK_PRIORITIES)}")
 
+        # One timestamp for completed_at and updated_at
+        now = datetime.now(timezone.utc)
+        now_value = now.isoformat() if self._ph == "qmark" else now
+
         # Build dynamic update
-        updates = []
-        params = []
+        updates: dict[str, Any] = {}
 
         if title is not None:
-            updates.append("title")
-            params.append(title)
+            updates["title"] = title
 
         if description is not None:
-            updates.append("description")
-            params.append(description)
+            updates["description"] = description
 
         if status is not None:
-            updates.append("status")
-            params.append(status)
+            updates["status"] = status
             # Set completed_at if status is done
             if status == "done":
-                updates.append("completed_at")
-                params.append(datetime.utcnow().isoformat() if self.adapter.placeholder_style == "qmark" else datetime.utcnow())
+                updates["completed_at"] = now_value
 
         if priority is not None:
-            updates.append("priority")
-            params.append(priority)
+            updates["priority"] = priority
 
         if assignee is not None:
-            updates.append("assignee")
-            params.append(assignee)
+            updates["assignee"] = assignee
 
         if tags is not None:
-            updates.append("tags")
-            params.append(json.dumps(tags) if not self.adapter.supports_arrays else tags)
+            updates["tags"] = json_dumps(tags) if not self._arrays else tags
 
         if due_at is not None:
-            updates.append("due_at")
-            params.append(due_at.isoformat() if self.adapter.placeholder_style == "qmark" else due_at)
+            updates["due_at"] = due_at.isoformat() if self._ph == "qmark" else due_at
 
         if not updates:
             return await self.get(task_id)
 
         # Add updated_at
-        updates.append("updated_at")
-        now = datetime.utcnow()
-        params.append(now.isoformat() if self.adapter.placeholder_style == "qmark" else now)
+        updates["updated_at"] = now_value
 
-        table = self._table_name()
+        # Sort columns so equivalent updates share one cached statement
+        columns = tuple(sorted(updates))
+        returning = self.adapter.supports_returning
+        query = _update_sql(self._table, columns, self._ph, returning)
+        params = [updates[col] for col in columns]
         params.append(task_id)
 
-        if self.adapter.placeholder_style == "dollar":
-            set_clause = ", ".join([f"{col} = ${i+1}" for i, col in enumerate(updates)])
-            query = f"""
-                UPDATE {table}
-                SET {set_clause}
-                WHERE id = ${len(params)} AND deleted_at IS NULL
-            """
-        else:
-            set_clause = ", ".join([f"{col} = ?" for col in updates])
-            query = f"""
-                UPDATE {table}
-                SET {set_clause}
-                WHERE id = ? AND deleted_at IS NULL
-            """
+        # One round-trip where the adapter can hand back the updated row
+        if returning:
+            row = await self.adapter.fetchrow(query, *params)
+            self._invalidate(task_id)
+            if row is None:
+                return None
+            self._task_cache.set(task_id, row)
+            return Task.from_row(row)
 
         await self.adapter.execute(query, *params)
+        self._invalidate(task_id)
         return await self.get(task_id)
 
     async def delete(self, task_id: str) -> bool:
         """Soft delete a task."""
-        table = self._table_name()
-        now = datetime.utcnow()
-
-        if self.adapter.placeholder_style == "dollar":
-            result = await self.adapter.execute(
-                f"UPDATE {table} SET deleted_at = $1 WHERE id = $2 AND deleted_at IS NULL",
-                now, task_id,
-            )
-        else:
-            result = await self.adapter.execute(
-                f"UPDATE {table} SET deleted_at = ? WHERE id = ? AND deleted_at IS NULL",
-                now.isoformat(), task_id,
-            )
+        now = datetime.now(timezone.utc)
+        result = await self.adapter.execute(
+            self._delete_sql,
+            now if self._ph == "dollar" else now.isoformat(),
+            task_id,
+        )
+        self._invalidate(task_id)
 
-        return "1" in result  # Check if a row was updated
+        return status_rowcount(result) > 0
 
     async def list(
         self,
@@ -267,46 +446,86 @@ class TaskService:
         Returns:
             List of Task objects
         """
-        conditions = ["deleted_at IS NULL"]
-        params = []
+        rows = await self._list_rows(status, priority, assignee, created_by, limit, offset)
+        return [Task.from_row(row) for row in rows]
 
-        if status:
-            conditions.append(f"status = ${len(params)+1}" if self.adapter.placeholder_style == "dollar" else "status = ?")
-            params.append(status)
-
-        if priority:
-            conditions.append(f"priority = ${len(params)+1}" if self.adapter.placeholder_style == "dollar" else "priority = ?")
-            params.append(priority)
+    async def list_dicts(
+        self,
+        status: str | None = None,
+        priority: str | None = None,
+        assignee: str | None = None,
+        created_by: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> builtins.list[dict]:
+        """
+        List tasks as serialized dicts, without building Task objects.
 
-        if assignee:
-            conditions.append(f"assignee = ${len(params)+1}" if self.adapter.placeholder_style == "dollar" else "assignee = ?")
-            params.append(assignee)
+        Takes the same filters as list(). Each dict has the same shape
+        as Task.to_dict().
+        """
+        rows = await self._list_rows(status, priority, assignee, created_by, limit, offset)
+        return [self._row_to_dict(row) for row in rows]
 
-        if created_by:
-            conditions.append(f"created_by = ${len(params)+1}" if self.adapter.placeholder_style == "dollar" else "created_by = ?")
-            params.append(created_by)
+    async def _list_rows(
+        self,
+        status: str | None,
+        priority: str | None,
+        assignee: str | None,
+        created_by: str | None,
+        limit: int,
+        offset: int,
+    ) -> Sequence[Mapping]:
+        """Run the filtered list query and return raw rows, cached briefly."""
+        key = (self._generation, status, priority, assignee, created_by, limit, offset)
+        rows = self._list_cache.get(key)
+        if rows is not None:
+            return rows
+
+        ph = _DOLLAR if self._ph == "dollar" else _QMARK
+        conditions = ["deleted_at IS NULL"]
+        params = []
+        n = 0
+
+        for column, value in (
+            ("status", status),
+            ("priority", priority),
+            ("assignee", assignee),
+            ("created_by", created_by),
+        ):
+            if value:
+                conditions.append(f"{column} = {ph[n]}")
+                params.append(value)
+                n += 1
 
-        table = self._table_name()
         where_clause = " AND ".join(conditions)
-
-        if self.adapter.placeholder_style == "dollar":
-            query = f"""
-                SELECT * FROM {table}
-                WHERE {where_clause}
-                ORDER BY created_at DESC
-                LIMIT ${len(params)+1} OFFSET ${len(params)+2}
-            """
-        else:
-            query = f"""
-                SELECT * FROM {table}
-                WHERE {where_clause}
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """
+        query = f"""
+            SELECT {_SELECT_COLUMNS} FROM {self._table}
+            WHERE {where_clause}
+            ORDER BY created_at DESC
+            LIMIT {ph[n]} OFFSET {ph[n + 1]}
+        """
 
         params.extend([limit, offset])
-        rows = await self.adapter.fetch(query, *params)
-        return [Task.from_dict(row) for row in rows]
+        rows = await self.adapter.fetch_records(query, *params)
+        self._list_cache.set(key, rows)
+        return rows
+
+    def _row_to_dict(self, row: Mapping) -> dict:
+        """Normalize a database row to the Task.to_dict() shape."""
+        data = {column: row[column] for column in _TASK_COLUMNS}
+        if data["id"] is not None:
+            data["id"] = str(data["id"])
+        tags = data["tags"]
+        if isinstance(tags, str):
+            data["tags"] = json_loads(tags)
+        elif tags is None:
+            data["tags"] = []
+        for column in _TASK_DATETIME_COLUMNS:
+            value = data[column]
+            if isinstance(value, datetime):
+                data[column] = value.isoformat()
+        return data
 
     async def search(
         self,
@@ -325,19 +544,45 @@ class TaskService:
         Returns:
             List of matching Task objects
         """
-        table = self._table_name()
+        rows = await self._search_rows(query, status, limit)
+        return [Task.from_row(row) for row in rows]
+
+    async def search_dicts(
+        self,
+        query: str,
+        status: str | None = None,
+        limit: int = 20,
+    ) -> builtins.list[dict]:
+        """
+        Search tasks, returning serialized dicts instead of Task objects.
+
+        Takes the same arguments as search(). Each dict has the same shape
+        as Task.to_dict().
+        """
+        rows = await self._search_rows(query, status, limit)
+        return [self._row_to_dict(row) for row in rows]
+
+    async def _search_rows(
+        self,
+        query: str,
+        status: str | None,
+        limit: int,
+    ) -> builtins.list[dict]:
+        """Run the text search and return raw rows."""
         where_clause = None
+        where_params = []
         if status:
-            where_clause = f"status = '{status}'"
+            where_clause = "status = $1"
+            where_params.append(status)
 
-        rows = await self.adapter.search_text(
-            table=table,
+        return await self.adapter.search_text(
+            table=self._table,
             query=query,
             columns=["title", "description"],
             limit=limit,
             where_clause=where_clause,
+            where_params=where_params,
         )
-        return [Task.from_dict(row) for row in rows]
 
     async def assign(self, task_id: str, assignee: str) -> Task | None:
         """Assign a task to a user."""
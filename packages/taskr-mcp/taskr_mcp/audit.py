@@ -0,0 +1,143 @@
+"""
+Buffered SQL audit logging for the Taskr MCP server.
+
+taskr_sql_migrate enqueues one row per migration; a background task writes
+them to sql_audit_log in batches so callers don't wait on the audit INSERT.
+The server's lifespan writes whatever is still queued when it shuts down.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_AUDIT_INSERT_SQL = (
+    "INSERT INTO sql_audit_log (sql_text, reason, executed_by, execution_time_ms) "
+    "VALUES ($1, $2, $3, $4)"
+)
+
+
+class AuditLogWriter:
+    """
+    Batches audit rows and flushes them on size or time.
+
+    Rows are held in memory until flushed, so up to one flush interval of
+    entries can be lost if the process dies. When the queue is full, new
+    rows are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_pending: int = 4096,
+        cmd_limit: int | None = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            batch_size: Rows per INSERT batch (env TASKR_AUDIT_BATCH_SIZE, default 64)
+            flush_interval: Max seconds a row waits (env TASKR_AUDIT_FLUSH_INTERVAL, default 1.0)
+            max_pending: Queue bound; rows beyond it are dropped
+            cmd_limit: Max characters of SQL kept per row (env TASKR_AUDIT_CMD_LIMIT, default 10000)
+        """
+        self.batch_size = batch_size or int(os.environ.get("TASKR_AUDIT_BATCH_SIZE", 64))
+        self.flush_interval = flush_interval or float(
+            os.environ.get("TASKR_AUDIT_FLUSH_INTERVAL", 1.0)
+        )
+        self.cmd_limit = cmd_limit or int(os.environ.get("TASKR_AUDIT_CMD_LIMIT", 10000))
+        self.dropped = 0
+        self._queue: asyncio.Queue[tuple] = asyncio.Queue(maxsize=max_pending)
+        self._adapter = None
+        self._task: asyncio.Task | None = None
+
+    def start(self, adapter) -> None:
+        """Start the background flusher on the running loop (idempotent)."""
+        self._adapter = adapter
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def enqueue(
+        self,
+        sql_text: str,
+        reason: str,
+        executed_by: str,
+        execution_time_ms: float,
+    ) -> None:
+        """Queue one audit row without waiting for it to be written."""
+        if len(sql_text) > self.cmd_limit:
+            sql_text = sql_text[:self.cmd_limit]
+        try:
+            self._queue.put_nowait((sql_text, reason, executed_by, execution_time_ms))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Audit queue full, dropped entry ({self.dropped} total)")
+
+    async def flush(self) -> None:
+        """Write everything currently queued."""
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._write(batch)
+
+    async def aclose(self) -> None:
+        """Stop the flusher and write any pending rows."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    @asynccontextmanager
+    async def lifespan(self, _server: Any = None) -> AsyncIterator[None]:
+        """Server lifespan hook: on shutdown, stop the flusher and write pending rows."""
+        try:
+            yield
+        finally:
+            await self.aclose()
+
+    async def _run(self) -> None:
+        """Collect rows until the batch fills or the interval passes, then write."""
+        loop = asyncio.get_running_loop()
+        batch: list[tuple] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._write(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # Rows already taken off the queue would otherwise be lost
+            if batch:
+                await self._write(batch)
+            raise
+
+    async def _write(self, batch: list[tuple]) -> None:
+        """Insert a batch; audit failures are logged, never raised."""
+        if self._adapter is None:
+            logger.warning(f"Audit writer not started, dropped {len(batch)} entries")
+            return
+        try:
+            await self._adapter.executemany(_AUDIT_INSERT_SQL, batch)
+        except Exception as e:
+            # Audit table might not exist, that's OK
+            logger.debug(f"Audit log write failed ({len(batch)} entries): {e}")
@@ -4,7 +4,10 @@ Plugin discovery and loading for Taskr MCP server.
 Plugins are discovered via Python entry points in the 'taskr.plugins' group.
 """
 
+import asyncio
 import logging
+from collections.abc import Collection
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,7 +18,7 @@ from taskr.plugins import TaskrPlugin
 logger = logging.getLogger(__name__)
 
 
-def discover_plugins() -> list[TaskrPlugin]:
+def discover_plugins(names: Collection[str] | None = None) -> list[TaskrPlugin]:
     """
     Discover installed plugins via entry points.
 
@@ -24,11 +27,21 @@ def discover_plugins() -> list[TaskrPlugin]:
         [project.entry-points."taskr.plugins"]
         my_plugin = "my_package.plugin:MyPlugin"
 
+    The entry point name must equal the plugin's PluginInfo.name, since
+    that is the name users list under plugins.enabled.
+
+    Args:
+        names: Optional plugin names to load. Entry points with other
+               names are skipped without being imported.
+
     Returns:
         List of TaskrPlugin instances
     """
     plugins = []
 
+    if names is not None and not names:
+        return plugins
+
     try:
         # Python 3.10+ has importlib.metadata in stdlib
         from importlib.metadata import entry_points
@@ -44,7 +57,13 @@ def discover_plugins() -> list[TaskrPlugin]:
         # Python 3.9 API
         eps = entry_points().get("taskr.plugins", [])
 
+    found = set()
     for ep in eps:
+        found.add(ep.name)
+        if names is not None and ep.name not in names:
+            logger.debug(f"Plugin {ep.name} not enabled, not loading")
+            continue
+
         try:
             plugin_class = ep.load()
             plugin = plugin_class()
@@ -55,12 +74,24 @@ def discover_plugins() -> list[TaskrPlugin]:
                 )
                 continue
 
+            if plugin.info.name != ep.name:
+                logger.warning(
+                    f"Plugin entry point '{ep.name}' reports name '{plugin.info.name}'; "
+                    f"the entry point name must match PluginInfo.name"
+                )
+
             plugins.append(plugin)
             logger.debug(f"Discovered plugin: {plugin.info.name} v{plugin.info.version}")
 
         except Exception as e:
             logger.warning(f"Failed to load plugin {ep.name}: {e}")
 
+    if names is not None:
+        for name in sorted(set(names) - found):
+            logger.warning(
+                f"Enabled plugin '{name}' has no 'taskr.plugins' entry point with that name"
+            )
+
     return plugins
 
 
@@ -82,13 +113,14 @@ def load_plugins(mcp: "FastMCP") -> list[TaskrPlugin]:
 
     config = get_config()
     adapter = get_adapter()
-    enabled_plugins = config.plugins.enabled
+    enabled_plugins = set(config.plugins.enabled)
 
     if not enabled_plugins:
         logger.info("No plugins enabled")
         return []
 
-    plugins = discover_plugins()
+    # Entry point names match plugin names, so only enabled plugins are imported
+    plugins = discover_plugins(enabled_plugins)
     loaded = []
 
     for plugin in plugins:
@@ -123,49 +155,64 @@ def load_plugins(mcp: "FastMCP") -> list[TaskrPlugin]:
     return loaded
 
 
+async def _apply_plugin_migrations(adapter, plugin: TaskrPlugin) -> None:
+    """Apply one plugin's migration files in order."""
+    for migration_path in plugin.get_migrations():
+        path = Path(migration_path)
+
+        if not path.exists():
+            logger.warning(
+                f"Plugin {plugin.info.name} migration not found: {migration_path}"
+            )
+            continue
+
+        try:
+            await adapter.execute_script(path.read_text())
+
+            logger.info(
+                f"Applied plugin migration: {plugin.info.name}/{path.name}"
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Plugin {plugin.info.name} migration failed ({path.name}): {e}"
+            )
+            raise
+
+
 async def run_plugin_migrations(plugins: list[TaskrPlugin]) -> None:
     """
     Run migrations for loaded plugins.
 
+    Plugins are independent, so each plugin's migrations run concurrently;
+    files within a plugin are still applied in order. If one plugin fails,
+    the others are cancelled and awaited before its error is raised.
+
     Args:
         plugins: List of loaded plugins
     """
-    from pathlib import Path
-
     from taskr.db import get_adapter
 
     adapter = get_adapter()
 
-    for plugin in plugins:
-        migrations = plugin.get_migrations()
-
-        for migration_path in migrations:
-            path = Path(migration_path)
+    tasks = [
+        asyncio.create_task(_apply_plugin_migrations(adapter, plugin))
+        for plugin in plugins
+    ]
+    if not tasks:
+        return
 
-            if not path.exists():
-                logger.warning(
-                    f"Plugin {plugin.info.name} migration not found: {migration_path}"
-                )
-                continue
-
-            try:
-                sql = path.read_text()
-
-                # Execute migration
-                for statement in sql.split(";"):
-                    statement = statement.strip()
-                    if statement and not statement.startswith("--"):
-                        await adapter.execute(statement)
-
-                logger.info(
-                    f"Applied plugin migration: {plugin.info.name}/{path.name}"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Plugin {plugin.info.name} migration failed ({path.name}): {e}"
-                )
-                raise
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled migrations unwind; this also retrieves every exception
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
 
 
 def shutdown_plugins(plugins: list[TaskrPlugin]) -> None:
@@ -5,88 +5,153 @@ AI-native task management MCP server with support for PostgreSQL and SQLite.
 """
 
 import asyncio
+import functools
 import logging
-from datetime import datetime
+import re
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+from taskr.cache import TTLCache
+from taskr.config import TaskrConfig, load_config
+from taskr.db import DatabaseAdapter, init_adapter
+from taskr.services import DevlogService, SessionService, TaskService
+from taskr_mcp.audit import AuditLogWriter
+
+# Batches taskr_sql_migrate audit rows off the request path; the server
+# lifespan writes any rows still queued when it stops
+_audit_writer = AuditLogWriter()
+
 # Initialize FastMCP server
-mcp = FastMCP("taskr")
+mcp = FastMCP("taskr", lifespan=_audit_writer.lifespan)
 
 logger = logging.getLogger(__name__)
 
 # Global state
-_initialized = False
+# Set once the adapter is ready and migrations have run; the lock makes
+# concurrent first calls wait for a single initialization.
+_init_event = asyncio.Event()
+_init_lock = asyncio.Lock()
+
+# Config, adapter and services, created once during initialization
+_config: TaskrConfig | None = None
+_adapter: DatabaseAdapter | None = None
+_task_service: TaskService | None = None
+_devlog_service: DevlogService | None = None
+_session_service: SessionService | None = None
+
+# Identity is fixed after startup, so tools read these directly
+_AGENT_ID: str = ""
+_AUTHOR: str | None = None
 
 
 async def ensure_initialized():
     """Ensure database is initialized."""
-    global _initialized
-    if _initialized:
+    if _init_event.is_set():
         return
+    await _initialize()
 
-    from taskr.config import load_config
-    from taskr.db import init_adapter
 
-    config = load_config()
-    adapter = await init_adapter(config)
+async def _initialize():
+    """Initialize the adapter and run migrations exactly once."""
+    global _config, _adapter, _task_service, _devlog_service, _session_service
+    global _AGENT_ID, _AUTHOR
 
-    # Run migrations if needed
-    await run_migrations(adapter)
+    async with _init_lock:
+        if _init_event.is_set():
+            return
 
-    _initialized = True
-    logger.info("Taskr initialized")
+        config = load_config()
+        adapter = await init_adapter(config)
 
+        # Run migrations if needed
+        await run_migrations(adapter)
 
-async def run_migrations(adapter):
-    """Run pending database migrations."""
+        _config = config
+        _AGENT_ID = config.agent_id
+        _AUTHOR = config.author
+        _adapter = adapter
+        _task_service = TaskService(adapter)
+        _devlog_service = DevlogService(adapter)
+        _session_service = SessionService(adapter)
+        _audit_writer.start(adapter)
+
+        _init_event.set()
+        logger.info("Taskr initialized")
 
-    # Determine migration path based on adapter type
-    if adapter.supports_fts:  # PostgreSQL
-        migrations_dir = Path(__file__).parent.parent.parent / "taskr-core" / "migrations" / "postgres"
-    else:  # SQLite
-        migrations_dir = Path(__file__).parent.parent.parent / "taskr-core" / "migrations" / "sqlite"
+
+def _resolve_migrations_dir(dialect: str) -> Path:
+    """Find core migrations in the source tree, else in the installed package."""
+    migrations_dir = Path(__file__).parent.parent.parent / "taskr-core" / "migrations" / dialect
 
     # For development, also check installed package location
     if not migrations_dir.exists():
         import taskr
-        pkg_path = Path(taskr.__file__).parent
-        if adapter.supports_fts:
-            migrations_dir = pkg_path / "migrations" / "postgres"
-        else:
-            migrations_dir = pkg_path / "migrations" / "sqlite"
+        migrations_dir = Path(taskr.__file__).parent / "migrations" / dialect
+
+    return migrations_dir
+
+
+# Resolved once at import; run_migrations only picks one
+_PG_MIGRATIONS_DIR = _resolve_migrations_dir("postgres")
+_SQLITE_MIGRATIONS_DIR = _resolve_migrations_dir("sqlite")
+
+
+@functools.cache
+def _migration_files(migrations_dir: Path) -> tuple[Path, ...]:
+    """Sorted migration files in a directory, listed once per process."""
+    return tuple(sorted(migrations_dir.glob("*.sql")))
+
+
+async def run_migrations(adapter):
+    """Run pending database migrations."""
+
+    # Determine migration path based on adapter type
+    migrations_dir = _PG_MIGRATIONS_DIR if adapter.supports_fts else _SQLITE_MIGRATIONS_DIR
 
     if not migrations_dir.exists():
         logger.warning(f"Migrations directory not found: {migrations_dir}")
         return
 
-    # Get applied migrations
+    files = _migration_files(migrations_dir)
+    candidate_versions = [sql_file.name.split("_")[0] for sql_file in files]
+    if not candidate_versions:
+        return
+
+    # Ask only about the versions shipped here, not every applied row
     try:
         if adapter.supports_fts:
-            applied = await adapter.fetch("SELECT version FROM taskr.schema_migrations")
+            applied = await adapter.fetch(
+                "SELECT version FROM taskr.schema_migrations WHERE version = ANY($1::text[])",
+                candidate_versions,
+            )
         else:
-            applied = await adapter.fetch("SELECT version FROM schema_migrations")
+            placeholders = ", ".join(f"${i}" for i in range(1, len(candidate_versions) + 1))
+            applied = await adapter.fetch(
+                f"SELECT version FROM schema_migrations WHERE version IN ({placeholders})",
+                *candidate_versions,
+            )
         applied_versions = {row["version"] for row in applied}
     except Exception:
         # Table doesn't exist yet, run all migrations
         applied_versions = set()
 
-    # Run pending migrations
-    for sql_file in sorted(migrations_dir.glob("*.sql")):
-        version = sql_file.name.split("_")[0]
-        if version not in applied_versions:
-            logger.info(f"Running migration: {sql_file.name}")
-            sql = sql_file.read_text()
-            # Split by semicolons and execute each statement
-            for statement in sql.split(";"):
-                statement = statement.strip()
-                if statement and not statement.startswith("--"):
-                    try:
-                        await adapter.execute(statement)
-                    except Exception as e:
-                        logger.error(f"Migration error in {sql_file.name}: {e}")
-                        raise
+    # Read pending files up front, then send each one as a single script
+    pending = [
+        (sql_file.name, sql_file.read_text())
+        for sql_file, version in zip(files, candidate_versions, strict=True)
+        if version not in applied_versions
+    ]
+
+    for name, sql in pending:
+        logger.info(f"Running migration: {name}")
+        try:
+            await adapter.execute_script(sql)
+        except Exception as e:
+            logger.error(f"Migration error in {name}: {e}")
+            raise
 
 
 # =============================================================================
@@ -113,10 +178,7 @@ async def taskr_list(
         List of tasks with summary info
     """
     await ensure_initialized()
-    from taskr.services import TaskService
-
-    service = TaskService()
-    tasks = await service.list(
+    tasks = await _task_service.list_dicts(
         status=status,
         priority=priority,
         assignee=assignee,
@@ -124,7 +186,7 @@ async def taskr_list(
     )
 
     return {
-        "tasks": [t.to_dict() for t in tasks],
+        "tasks": tasks,
         "count": len(tasks),
     }
 
@@ -153,25 +215,43 @@ async def taskr_create(
         Created task details
     """
     await ensure_initialized()
-    from taskr.config import get_config
-    from taskr.services import TaskService
 
-    config = get_config()
-    service = TaskService()
-
-    task = await service.create(
+    task = await _task_service.create(
         title=title,
         description=description,
         status=status,
         priority=priority,
         assignee=assignee,
         tags=tags,
-        created_by=config.author,
+        created_by=_AUTHOR,
     )
 
     return task.to_dict()
 
 
+@mcp.tool()
+async def taskr_create_many(tasks: list[dict]) -> dict:
+    """
+    Create several tasks in one batch.
+
+    Args:
+        tasks: List of task objects, each with a required "title" and
+               optional description, status, priority, assignee, tags,
+               due_at (ISO 8601). Nothing is created if any item is invalid.
+
+    Returns:
+        Created tasks and count
+    """
+    await ensure_initialized()
+
+    created = await _task_service.create_many(tasks, created_by=_AUTHOR)
+
+    return {
+        "tasks": [t.to_dict() for t in created],
+        "count": len(created),
+    }
+
+
 @mcp.tool()
 async def taskr_show(task_id: str) -> dict:
     """
@@ -184,10 +264,7 @@ async def taskr_show(task_id: str) -> dict:
         Full task details
     """
     await ensure_initialized()
-    from taskr.services import TaskService
-
-    service = TaskService()
-    task = await service.get(task_id)
+    task = await _task_service.get(task_id)
 
     if not task:
         return {"error": f"Task not found: {task_id}"}
@@ -221,10 +298,7 @@ async def taskr_update(
         Updated task details
     """
     await ensure_initialized()
-    from taskr.services import TaskService
-
-    service = TaskService()
-    task = await service.update(
+    task = await _task_service.update(
         task_id=task_id,
         title=title,
         description=description,
@@ -258,17 +332,14 @@ async def taskr_search(
         List of matching tasks
     """
     await ensure_initialized()
-    from taskr.services import TaskService
-
-    service = TaskService()
-    tasks = await service.search(
+    tasks = await _task_service.search_dicts(
         query=query,
         status=status,
         limit=limit,
     )
 
     return {
-        "tasks": [t.to_dict() for t in tasks],
+        "tasks": tasks,
         "count": len(tasks),
         "query": query,
     }
@@ -287,10 +358,7 @@ async def taskr_assign(task_id: str, assignee: str) -> dict:
         Updated task details
     """
     await ensure_initialized()
-    from taskr.services import TaskService
-
-    service = TaskService()
-    task = await service.assign(task_id, assignee)
+    task = await _task_service.assign(task_id, assignee)
 
     if not task:
         return {"error": f"Task not found: {task_id}"}
@@ -310,10 +378,7 @@ async def taskr_close(task_id: str) -> dict:
         Updated task details
     """
     await ensure_initialized()
-    from taskr.services import TaskService
-
-    service = TaskService()
-    task = await service.close(task_id)
+    task = await _task_service.close(task_id)
 
     if not task:
         return {"error": f"Task not found: {task_id}"}
@@ -350,18 +415,13 @@ async def devlog_add(
         Created devlog with id and timestamps
     """
     await ensure_initialized()
-    from taskr.config import get_config
-    from taskr.services import DevlogService
 
-    config = get_config()
-    service = DevlogService()
-
-    devlog = await service.add(
+    devlog = await _devlog_service.add(
         category=category,
         title=title,
         content=content,
-        author=config.author,
-        agent_id=config.agent_id,
+        author=_AUTHOR,
+        agent_id=_AGENT_ID,
         service_name=service_name,
         tags=tags,
     )
@@ -389,10 +449,7 @@ async def devlog_list(
         List of devlog summaries
     """
     await ensure_initialized()
-    from taskr.services import DevlogService
-
-    service = DevlogService()
-    devlogs = await service.list(
+    devlogs = await _devlog_service.list(
         category=category,
         service_name=service_name,
         tags=tags,
@@ -417,10 +474,7 @@ async def devlog_get(devlog_id: str) -> dict:
         Full devlog with content
     """
     await ensure_initialized()
-    from taskr.services import DevlogService
-
-    service = DevlogService()
-    devlog = await service.get(devlog_id)
+    devlog = await _devlog_service.get(devlog_id)
 
     if not devlog:
         return {"error": f"Devlog not found: {devlog_id}"}
@@ -431,7 +485,7 @@ async def devlog_get(devlog_id: str) -> dict:
 @mcp.tool()
 async def devlog_search(
     query: str,
-    category: str | None = None,
+    category: str | list[str] | None = None,
     service_name: str | None = None,
     limit: int = 20,
 ) -> dict:
@@ -443,7 +497,7 @@ async def devlog_search(
 
     Args:
         query: Search query
-        category: Optional category filter
+        category: Optional category filter, or a list to match any of them
         service_name: Optional service filter
         limit: Maximum results
 
@@ -451,10 +505,7 @@ async def devlog_search(
         List of matching devlogs ranked by relevance
     """
     await ensure_initialized()
-    from taskr.services import DevlogService
-
-    service = DevlogService()
-    devlogs = await service.search(
+    devlogs = await _devlog_service.search(
         query=query,
         category=category,
         service_name=service_name,
@@ -490,10 +541,7 @@ async def devlog_update(
         Updated devlog
     """
     await ensure_initialized()
-    from taskr.services import DevlogService
-
-    service = DevlogService()
-    devlog = await service.update(
+    devlog = await _devlog_service.update(
         devlog_id=devlog_id,
         title=title,
         content=content,
@@ -519,10 +567,7 @@ async def devlog_delete(devlog_id: str) -> dict:
         Success status
     """
     await ensure_initialized()
-    from taskr.services import DevlogService
-
-    service = DevlogService()
-    success = await service.delete(devlog_id)
+    success = await _devlog_service.delete(devlog_id)
 
     return {
         "deleted": success,
@@ -551,14 +596,9 @@ async def session_start(context: str | None = None) -> dict:
         Session ID and context from previous session
     """
     await ensure_initialized()
-    from taskr.config import get_config
-    from taskr.services import SessionService
 
-    config = get_config()
-    service = SessionService()
-
-    return await service.start(
-        agent_id=config.agent_id,
+    return await _session_service.start(
+        agent_id=_AGENT_ID,
         context=context,
     )
 
@@ -581,10 +621,8 @@ async def session_end(
         Session end confirmation with duration
     """
     await ensure_initialized()
-    from taskr.services import SessionService
 
-    service = SessionService()
-    return await service.end(
+    return await _session_service.end(
         session_id=session_id,
         summary=summary,
         handoff_notes=handoff_notes,
@@ -611,14 +649,9 @@ async def claim_work(
         Claim status and message
     """
     await ensure_initialized()
-    from taskr.config import get_config
-    from taskr.services import SessionService
-
-    config = get_config()
-    service = SessionService()
 
-    return await service.claim_work(
-        agent_id=config.agent_id,
+    return await _session_service.claim_work(
+        agent_id=_AGENT_ID,
         work_type=work_type,
         work_id=work_id,
         repo=repo,
@@ -647,14 +680,9 @@ async def release_work(
         Release confirmation
     """
     await ensure_initialized()
-    from taskr.config import get_config
-    from taskr.services import SessionService
-
-    config = get_config()
-    service = SessionService()
 
-    return await service.release_work(
-        agent_id=config.agent_id,
+    return await _session_service.release_work(
+        agent_id=_AGENT_ID,
         work_type=work_type,
         work_id=work_id,
         repo=repo,
@@ -679,12 +707,10 @@ async def what_changed(
         Activities and sessions since timestamp
     """
     await ensure_initialized()
-    from taskr.services import SessionService
 
-    service = SessionService()
-    since = datetime.utcnow() - __import__("datetime").timedelta(hours=hours_ago)
+    since = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
 
-    return await service.what_changed(since=since)
+    return await _session_service.what_changed(since=since)
 
 
 # =============================================================================
@@ -723,6 +749,12 @@ async def taskr_migrate() -> dict:
     return {"status": "migrations complete"}
 
 
+# Health results are reused briefly so polling orchestrators don't each
+# cost a round-trip; the lock lets one caller refresh while others wait.
+_health_cache = TTLCache(maxsize=1, ttl=1.0)
+_health_lock = asyncio.Lock()
+
+
 @mcp.tool()
 async def taskr_health() -> dict:
     """
@@ -732,43 +764,50 @@ async def taskr_health() -> dict:
         Health status including database type and connection info
     """
     await ensure_initialized()
-    from taskr.config import get_config
-    from taskr.db import get_adapter
 
-    config = get_config()
-    adapter = get_adapter()
+    cached = _health_cache.get("health")
+    if cached is not None:
+        return cached
 
-    # Test query
-    try:
-        if adapter.supports_fts:
-            result = await adapter.fetchval("SELECT 1")
-        else:
-            result = await adapter.fetchval("SELECT 1")
-        connected = result == 1
-    except Exception as e:
-        connected = False
-        logger.error(f"Health check failed: {e}")
+    async with _health_lock:
+        cached = _health_cache.get("health")
+        if cached is not None:
+            return cached
 
-    return {
-        "status": "healthy" if connected else "unhealthy",
-        "database_type": "postgres" if adapter.supports_fts else "sqlite",
-        "supports_fts": adapter.supports_fts,
-        "supports_vector": adapter.supports_vector,
-        "agent_id": config.agent_id,
-        "author": config.author,
-    }
+        # Test query
+        try:
+            result = await _adapter.fetchval("SELECT 1")
+            connected = result == 1
+        except Exception as e:
+            connected = False
+            logger.error(f"Health check failed: {e}")
+
+        health = {
+            "status": "healthy" if connected else "unhealthy",
+            "database_type": _adapter.kind,
+            "supports_fts": _adapter.supports_fts,
+            "supports_vector": _adapter.supports_vector,
+            "agent_id": _AGENT_ID,
+            "author": _AUTHOR,
+        }
+        _health_cache.set("health", health)
+        return health
 
 
 # =============================================================================
 # SQL TOOLS
 # =============================================================================
 
+# Read-only gate: matches the leading keyword without copying the query
+_READ_ONLY_RE = re.compile(r"\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+
 
 @mcp.tool()
 async def taskr_sql_query(
     query: str,
     params: list[str] | None = None,
     read_only: bool = True,
+    max_rows: int = 10000,
 ) -> dict:
     """
     Execute a SQL query against the taskr database.
@@ -780,35 +819,41 @@ async def taskr_sql_query(
         query: SQL query to execute
         params: Optional query parameters
         read_only: If True, only SELECT allowed (default True)
+        max_rows: Maximum rows returned (default 10000); "truncated" is set
+                  when the result had more
 
     Returns:
         Query results with rows, columns, and row count
     """
     await ensure_initialized()
-    import time
-
-    from taskr.db import get_adapter
-
-    adapter = get_adapter()
 
     # Validate read_only mode
     if read_only:
-        query_upper = query.strip().upper()
-        if not query_upper.startswith("SELECT") and not query_upper.startswith("WITH"):
+        if not _READ_ONLY_RE.match(query):
             return {
                 "error": "Only SELECT queries allowed in read_only mode. Set read_only=False for write operations."
             }
 
     try:
-        start = time.time()
-        rows = await adapter.fetch(query, *(params or []))
-        elapsed = time.time() - start
+        start = time.perf_counter()
+        # Read one extra row to detect truncation; read-only queries stream
+        # so oversized results are never fully materialized
+        if read_only:
+            rows = await _adapter.fetch_limited(query, *(params or []), max_rows=max_rows + 1)
+        else:
+            rows = await _adapter.fetch(query, *(params or []))
+        elapsed = time.perf_counter() - start
+
+        truncated = len(rows) > max_rows
+        if truncated:
+            rows = rows[:max_rows]
 
         return {
             "success": True,
             "rows": rows,
             "row_count": len(rows),
             "columns": list(rows[0].keys()) if rows else [],
+            "truncated": truncated,
             "execution_time_ms": round(elapsed * 1000, 2),
         }
     except Exception as e:
@@ -837,21 +882,17 @@ async def taskr_sql_explain(
         Query plan with cost estimates, actual times (if analyze=True), and suggestions
     """
     await ensure_initialized()
-    from taskr.db import get_adapter
-
-    adapter = get_adapter()
 
     # Only allow SELECT queries
-    query_upper = query.strip().upper()
-    if not query_upper.startswith("SELECT") and not query_upper.startswith("WITH"):
+    if not _READ_ONLY_RE.match(query):
         return {"error": "EXPLAIN only works with SELECT queries"}
 
     # SQLite doesn't support EXPLAIN ANALYZE the same way
-    if not adapter.supports_fts:
+    if not _adapter.supports_fts:
         # SQLite version - simpler EXPLAIN
         try:
             explain_query = f"EXPLAIN QUERY PLAN {query}"
-            rows = await adapter.fetch(explain_query, *(params or []))
+            rows = await _adapter.fetch(explain_query, *(params or []))
             return {
                 "database": "sqlite",
                 "plan": rows,
@@ -867,7 +908,7 @@ async def taskr_sql_explain(
         else:
             explain_query = f"EXPLAIN (FORMAT JSON) {query}"
 
-        rows = await adapter.fetch(explain_query, *(params or []))
+        rows = await _adapter.fetch(explain_query, *(params or []))
 
         if rows and rows[0]:
             plan = rows[0].get("QUERY PLAN", rows[0])
@@ -928,14 +969,8 @@ async def taskr_sql_migrate(
         Migration result with success status and execution time
     """
     await ensure_initialized()
-    import time
 
-    from taskr.config import get_config
-    from taskr.db import get_adapter
-
-    config = get_config()
-    adapter = get_adapter()
-    executed_by = executed_by or config.agent_id
+    executed_by = executed_by or _AGENT_ID
 
     if dry_run:
         return {
@@ -947,30 +982,25 @@ async def taskr_sql_migrate(
         }
 
     try:
-        start = time.time()
+        start = time.perf_counter()
 
         # Execute the migration
         # Note: For PostgreSQL, this runs in a transaction by default
-        await adapter.execute(sql)
+        await _adapter.execute(sql)
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
-        # Try to log to audit table (ignore if it doesn't exist)
-        try:
-            audit_sql = """
-                INSERT INTO sql_audit_log (sql_text, reason, executed_by, execution_time_ms)
-                VALUES ($1, $2, $3, $4)
-            """
-            await adapter.execute(audit_sql, sql[:10000], reason, executed_by, round(elapsed * 1000, 2))
-        except Exception:
-            # Audit table might not exist, that's OK
-            pass
+        elapsed_ms = round(elapsed * 1000, 2)
+
+        # Written in the background (SQL capped at TASKR_AUDIT_CMD_LIMIT);
+        # a missing audit table is ignored
+        _audit_writer.enqueue(sql, reason, executed_by, elapsed_ms)
 
         return {
             "success": True,
             "reason": reason,
             "executed_by": executed_by,
-            "execution_time_ms": round(elapsed * 1000, 2),
+            "execution_time_ms": elapsed_ms,
         }
     except Exception as e:
         return {"error": f"Migration failed: {str(e)}"}
@@ -5,25 +5,10 @@ Tools that help agents understand how to use taskr and find relevant context.
 """
 
 
-def register_context_tools(mcp):
-    """Register context discovery tools."""
-
-    @mcp.tool()
-    async def taskr_triage() -> dict:
-        """
-        Workflow coach - guides you on using taskr properly.
-
-        Call this when starting work to get guidance on:
-        - Whether to start a session
-        - How to claim work
-        - When to create devlogs
-        - Best practices for agent coordination
-
-        Returns:
-            Guidance on taskr workflow
-        """
-        return {
-            "guidance": """
+# Static guidance, built once at import. Returned as-is on every call, so
+# callers must treat it as read-only.
+_TRIAGE_RESPONSE = {
+    "guidance": """
 ## Taskr Workflow Guide
 
 ### Starting Work
@@ -46,11 +31,31 @@ def register_context_tools(mcp):
 - Use handoff_notes to communicate with your future self
 - Claim work before starting to prevent duplicate effort
 """,
-            "quick_commands": {
-                "start_work": "session_start(context='...')",
-                "check_patterns": "devlog_search(query='...')",
-                "claim_issue": "claim_work(work_type='issue', work_id='...', repo='...')",
-                "log_decision": "devlog_add(category='decision', title='...', content='...')",
-                "end_session": "session_end(session_id='...', summary='...', handoff_notes='...')",
-            },
-        }
+    "quick_commands": {
+        "start_work": "session_start(context='...')",
+        "check_patterns": "devlog_search(query='...')",
+        "claim_issue": "claim_work(work_type='issue', work_id='...', repo='...')",
+        "log_decision": "devlog_add(category='decision', title='...', content='...')",
+        "end_session": "session_end(session_id='...', summary='...', handoff_notes='...')",
+    },
+}
+
+
+def register_context_tools(mcp):
+    """Register context discovery tools."""
+
+    @mcp.tool()
+    async def taskr_triage() -> dict:
+        """
+        Workflow coach - guides you on using taskr properly.
+
+        Call this when starting work to get guidance on:
+        - Whether to start a session
+        - How to claim work
+        - When to create devlogs
+        - Best practices for agent coordination
+
+        Returns:
+            Guidance on taskr workflow
+        """
+        return _TRIAGE_RESPONSE
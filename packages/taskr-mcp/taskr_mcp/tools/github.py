@@ -9,26 +9,222 @@ Core GitHub tools that are essential to the taskr workflow:
 Authentication (in order of preference):
 1. gh CLI (recommended) - run `gh auth login` once
 2. GITHUB_TOKEN env var - for CI/automation
+
+Whenever a token is available (GITHUB_TOKEN, or borrowed once from
+`gh auth token`), requests go straight to api.github.com over a pooled
+HTTP client; the gh binary is only spawned when no token can be found.
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import logging
 import os
+import random
 import shutil
 import subprocess
-from typing import Optional
+import time
+from collections.abc import Collection
+from typing import Any, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+from taskr.cache import TTLCache
+from taskr.db.serialization import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
-# Cache for gh availability check
+# Cache for gh availability check. A negative result is retried after
+# _GH_RETRY_SECONDS so `gh auth login` mid-session is picked up without
+# every call paying for the probe.
 _gh_available: Optional[bool] = None
+_gh_checked_at = 0.0
+_GH_RETRY_SECONDS = 60.0
+
+# Token read from `gh auth token`; "" if gh is authenticated but it failed
+_gh_token: str | None = None
+
+# Shared keep-alive client so TLS/TCP setup is paid once, not per request.
+# With h2 installed (pip install taskr-mcp[http2]) it speaks HTTP/2, so
+# concurrent calls multiplex over one connection.
+_http_client: httpx.Client | None = None
+
+# github_get_issue_id results; titles can change, so entries expire
+_issue_cache = TTLCache(maxsize=512, ttl=300.0)
+
+# Most issues resolved by one github_get_issue_ids request
+_ISSUE_BATCH_SIZE = 100
+
+# Retries for rate-limited API requests, and the longest single wait
+_API_RETRIES = 3
+_API_MAX_BACKOFF = 30.0
+
+_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+    "Content-Type": "application/json",
+}
+
+
+# GraphQL documents, built once at import
+
+# Organization and user asked for together; the side that doesn't exist is null
+_OWNER_ID_QUERY = """
+query($login: String!) {
+    org: organization(login: $login) {
+        id
+    }
+    usr: user(login: $login) {
+        id
+    }
+}
+"""
+
+_ISSUE_NODE_ID_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+    repository(owner: $owner, name: $repo) {
+        issue(number: $number) {
+            id
+        }
+    }
+}
+"""
+
+_ISSUE_ID_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+    repository(owner: $owner, name: $repo) {
+        issue(number: $number) {
+            id
+            title
+        }
+    }
+}
+"""
+
+_CREATE_PROJECT_MUTATION = """
+mutation($ownerId: ID!, $title: String!) {
+    createProjectV2(input: { ownerId: $ownerId, title: $title }) {
+        projectV2 {
+            id
+            number
+            title
+            url
+        }
+    }
+}
+"""
+
+_ADD_PROJECT_ITEM_MUTATION = """
+mutation($projectId: ID!, $contentId: ID!) {
+    addProjectV2ItemById(input: { projectId: $projectId, contentId: $contentId }) {
+        item {
+            id
+        }
+    }
+}
+"""
+
+_SET_PROJECT_CLOSED_MUTATION = """
+mutation($projectId: ID!, $closed: Boolean!) {
+    updateProjectV2(input: { projectId: $projectId, closed: $closed }) {
+        projectV2 {
+            id
+            title
+            closed
+            url
+        }
+    }
+}
+"""
+
+# The issue's project and, unless REST already returned it, the PR's node ID
+_PR_PROJECT_LOOKUP_QUERY = """
+query($owner: String!, $repo: String!, $prNum: Int!, $issueNum: Int!, $needPr: Boolean!) {
+    repository(owner: $owner, name: $repo) {
+        pullRequest(number: $prNum) @include(if: $needPr) {
+            id
+        }
+        issue(number: $issueNum) {
+            projectItems(first: 1) {
+                nodes {
+                    project {
+                        id
+                        title
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# Project items for a login that may be an organization or a user; both
+# are asked for in one request and the side that doesn't exist is null.
+_PROJECT_ITEMS_QUERY = """
+query($login: String!, $number: Int!, $first: Int!, $after: String) {
+    org: organization(login: $login) {
+        projectV2(number: $number) {
+            ...ProjectItems
+        }
+    }
+    usr: user(login: $login) {
+        projectV2(number: $number) {
+            ...ProjectItems
+        }
+    }
+}
+
+fragment ProjectItems on ProjectV2 {
+    id
+    title
+    items(first: $first, after: $after) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        nodes {
+            id
+            fieldValueByName(name: "Status") {
+                ... on ProjectV2ItemFieldSingleSelectValue {
+                    name
+                }
+            }
+            content {
+                ... on Issue {
+                    number
+                    title
+                    state
+                }
+                ... on PullRequest {
+                    number
+                    title
+                    state
+                }
+                ... on DraftIssue {
+                    title
+                }
+            }
+        }
+    }
+}
+"""
 
 
 def gh_available() -> bool:
     """Check if gh CLI is installed and authenticated."""
-    global _gh_available
-    if _gh_available is not None:
+    global _gh_available, _gh_checked_at
+    if _gh_available or (
+        _gh_available is False and time.monotonic() - _gh_checked_at < _GH_RETRY_SECONDS
+    ):
         return _gh_available
+    _gh_checked_at = time.monotonic()
 
     # Check if gh is installed
     if not shutil.which("gh"):
@@ -38,17 +234,22 @@ def gh_available() -> bool:
 
     # Check if gh is authenticated
     try:
+        # Local check in the happy path; a slow probe means gh is unusable
         result = subprocess.run(
             ["gh", "auth", "status"],
             capture_output=True,
-            text=True,
-            timeout=10,
+            encoding="utf-8",
+            check=False,
+            timeout=2,
         )
         _gh_available = result.returncode == 0
         if _gh_available:
             logger.debug("gh CLI authenticated and ready")
         else:
             logger.debug(f"gh CLI not authenticated: {result.stderr}")
+    except subprocess.TimeoutExpired:
+        logger.warning("gh auth status timed out; using the GitHub API directly")
+        _gh_available = False
     except Exception as e:
         logger.debug(f"gh auth check failed: {e}")
         _gh_available = False
@@ -56,37 +257,61 @@ def gh_available() -> bool:
     return _gh_available
 
 
-def gh_api_graphql(query: str, variables: dict) -> dict:
-    """Execute a GraphQL query using gh CLI."""
-    # Build the gh api graphql command
-    cmd = [
-        "gh", "api", "graphql",
-        "-f", f"query={query}",
+def _graphql_data(response: dict, tolerate: Collection[str] = ()) -> dict:
+    """
+    Return the data of a GraphQL response, raising on errors.
+
+    Errors whose path starts with a field in tolerate (e.g. an aliased
+    lookup that is expected to miss) are ignored; that field is null.
+    """
+    errors = [
+        error for error in response.get("errors") or []
+        if not (error.get("path") and error["path"][0] in tolerate)
     ]
+    if errors:
+        raise ValueError(f"GraphQL error: {errors}")
 
-    # Add variables
-    for key, value in variables.items():
-        if isinstance(value, int):
-            cmd.extend(["-F", f"{key}={value}"])
-        else:
-            cmd.extend(["-f", f"{key}={value}"])
+    return response.get("data") or {}
+
+
+def _gh_field(key: str, value: Any) -> tuple[str, str]:
+    """Flag for one variable: -F for typed (bool/int) values, -f for strings."""
+    if isinstance(value, bool):
+        # gh only converts lowercase true/false to JSON booleans
+        return "-F", f"{key}={str(value).lower()}"
+    if isinstance(value, int):
+        return "-F", f"{key}={value}"
+    return "-f", f"{key}={value}"
+
+
+def gh_api_graphql(query: str, variables: dict, tolerate: Collection[str] = ()) -> dict:
+    """Execute a GraphQL query using gh CLI."""
+    # None variables are left out, which GraphQL treats as null
+    var_args = [
+        arg
+        for key, value in variables.items() if value is not None
+        for arg in _gh_field(key, value)
+    ]
+    cmd = ["gh", "api", "graphql", "-f", f"query={query}", *var_args]
 
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
+        encoding="utf-8",
+        check=False,
         timeout=30,
     )
 
-    if result.returncode != 0:
+    # gh exits non-zero on any GraphQL error but still prints the response
+    if result.returncode != 0 and not (tolerate and result.stdout.strip()):
         raise ValueError(f"gh api error: {result.stderr}")
 
-    response = json.loads(result.stdout)
-
-    if "errors" in response:
-        raise ValueError(f"GraphQL error: {response['errors']}")
+    try:
+        response = json_loads(result.stdout)
+    except json.JSONDecodeError:
+        raise ValueError(f"gh api error: {result.stderr}") from None
 
-    return response.get("data", {})
+    return _graphql_data(response, tolerate)
 
 
 def gh_run(args: list[str], json_output: bool = True) -> dict:
@@ -99,7 +324,8 @@ def gh_run(args: list[str], json_output: bool = True) -> dict:
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
+        encoding="utf-8",
+        check=False,
         timeout=30,
     )
 
@@ -107,15 +333,126 @@ def gh_run(args: list[str], json_output: bool = True) -> dict:
         raise ValueError(f"gh error: {result.stderr}")
 
     if json_output and result.stdout.strip():
-        return json.loads(result.stdout)
+        return json_loads(result.stdout)
 
     return {"output": result.stdout}
 
 
-# Fallback to direct API if gh not available
+async def _run_gh(args: list[str], timeout: float = 30) -> tuple[int, str, str]:
+    """Run a gh command without blocking the event loop; returns (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        "gh", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise ValueError(f"gh {args[0]} timed out after {timeout}s") from None
+
+    return proc.returncode, stdout.decode("utf-8"), stderr.decode("utf-8")
+
+
+def _number_from_url(url: str) -> int:
+    """Extract the issue/PR number from the URL printed by gh create commands."""
+    try:
+        return int(url.rsplit("/", 1)[-1])
+    except ValueError:
+        raise ValueError(f"Could not read an issue/PR number from gh output: {url!r}") from None
+
+
+def _gh_auth_token() -> str | None:
+    """Read the gh CLI's token once so API calls can skip the subprocess."""
+    global _gh_token
+    if _gh_token is None and gh_available():
+        _gh_token = ""
+        try:
+            result = subprocess.run(
+                ["gh", "auth", "token"],
+                capture_output=True,
+                encoding="utf-8",
+                check=False,
+                timeout=10,
+            )
+            if result.returncode == 0:
+                _gh_token = result.stdout.strip()
+        except Exception as e:
+            logger.debug(f"gh auth token failed: {e}")
+    return _gh_token or None
+
+
 def _get_token() -> Optional[str]:
-    """Get GitHub token from environment (fallback when gh not available)."""
-    return os.environ.get("GITHUB_TOKEN")
+    """Get GitHub token from GITHUB_TOKEN, else from the gh CLI."""
+    return os.environ.get("GITHUB_TOKEN") or _gh_auth_token()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared GitHub API client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        # The transport also retries failed connection attempts
+        transport = httpx.HTTPTransport(
+            http2=HAS_H2,
+            retries=_API_RETRIES,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        _http_client = httpx.Client(
+            base_url="https://api.github.com",
+            headers=_API_HEADERS,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=transport,
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+def _rate_limited(response: httpx.Response) -> bool:
+    """Is this a primary (403 with no quota left) or secondary (429) rate limit?"""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0"
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited response."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        return float(retry_after)
+
+    # Primary limit: wait for the quota window to reset
+    reset_at = response.headers.get("X-RateLimit-Reset")
+    if reset_at and response.headers.get("X-RateLimit-Remaining") == "0":
+        return max(float(reset_at) - time.time(), 0.0)
+
+    return 2 ** attempt + random.random()
+
+
+def _api_post(path: str, token: str, payload: dict) -> Any:
+    """
+    POST to the GitHub API and decode the JSON body.
+
+    Rate-limited requests are retried up to _API_RETRIES times, waiting for
+    Retry-After or X-RateLimit-Reset when given, else exponential backoff
+    with jitter (capped at _API_MAX_BACKOFF seconds). Other error statuses
+    raise ValueError.
+    """
+    client = _get_http_client()
+    body = json_dumps(payload)
+    for attempt in range(_API_RETRIES + 1):
+        response = client.post(path, headers={"Authorization": f"Bearer {token}"}, content=body)
+        if attempt == _API_RETRIES or not _rate_limited(response):
+            break
+
+        delay = min(_retry_delay(response, attempt), _API_MAX_BACKOFF)
+        logger.warning(f"GitHub API rate limited, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+    if response.status_code >= 400:
+        raise ValueError(f"GitHub API {response.status_code}: {response.text[:500]}")
+
+    return json_loads(response.content)
 
 
 def _direct_api_available() -> bool:
@@ -123,10 +460,8 @@ def _direct_api_available() -> bool:
     return bool(_get_token())
 
 
-def _direct_graphql(query: str, variables: dict) -> dict:
+def _direct_graphql(query: str, variables: dict, tolerate: Collection[str] = ()) -> dict:
     """Execute GraphQL via direct HTTP (fallback)."""
-    import httpx
-
     token = _get_token()
     if not token:
         raise ValueError(
@@ -135,64 +470,72 @@ def _direct_graphql(query: str, variables: dict) -> dict:
             "  2. Set GITHUB_TOKEN environment variable"
         )
 
-    response = httpx.post(
-        "https://api.github.com/graphql",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
-        json={"query": query, "variables": variables},
-        timeout=30.0,
-    )
-    response.raise_for_status()
-    result = response.json()
-
-    if "errors" in result:
-        raise ValueError(f"GraphQL error: {result['errors']}")
+    response = _api_post("/graphql", token, {"query": query, "variables": variables})
+    return _graphql_data(response, tolerate)
 
-    return result.get("data", {})
 
+def graphql_request(query: str, variables: dict, tolerate: Collection[str] = ()) -> dict:
+    """
+    Execute a GraphQL request over HTTP when a token exists, else via gh CLI.
 
-def graphql_request(query: str, variables: dict) -> dict:
-    """Execute a GraphQL request using gh CLI or direct API."""
-    if gh_available():
-        return gh_api_graphql(query, variables)
-    else:
-        return _direct_graphql(query, variables)
+    Errors on the top-level fields named in tolerate are not raised.
+    """
+    if not _get_token() and gh_available():
+        return gh_api_graphql(query, variables, tolerate)
+    return _direct_graphql(query, variables, tolerate)
 
 
+@functools.lru_cache(maxsize=128)
 def get_owner_id(login: str) -> tuple[str, str]:
-    """Get the node ID for a GitHub organization or user."""
-    # Try as organization first
-    query = """
-    query($login: String!) {
-        organization(login: $login) {
-            id
-        }
-    }
     """
-    try:
-        result = graphql_request(query, {"login": login})
-        if result.get("organization"):
-            return result["organization"]["id"], "organization"
-    except Exception:
-        pass
-
-    # Try as user
-    query = """
-    query($login: String!) {
-        user(login: $login) {
-            id
-        }
-    }
+    Get the node ID for a GitHub organization or user.
+
+    Node IDs never change, so results are cached for the process lifetime
+    (clear with get_owner_id.cache_clear()); failed lookups are not cached.
     """
-    result = graphql_request(query, {"login": login})
-    if result.get("user"):
-        return result["user"]["id"], "user"
+    # One round-trip for both; the side that doesn't exist comes back null
+    result = graphql_request(_OWNER_ID_QUERY, {"login": login}, tolerate=("org", "usr"))
+    if result.get("org"):
+        return result["org"]["id"], "organization"
+    if result.get("usr"):
+        return result["usr"]["id"], "user"
 
     raise ValueError(f"Could not find organization or user: {login}")
 
 
+@functools.lru_cache(maxsize=512)
+def _get_issue_node_id(owner: str, repo: str, number: int) -> str:
+    """Get an issue's node ID; IDs never change, so they are cached for the process."""
+    result = graphql_request(_ISSUE_NODE_ID_QUERY, {"owner": owner, "repo": repo, "number": number})
+    return result["repository"]["issue"]["id"]
+
+
+@functools.lru_cache(maxsize=32)
+def _issue_ids_query(count: int) -> str:
+    """Build a query for count issues, aliased i0..i{count-1} with variables $n0..."""
+    params = "".join(f", $n{i}: Int!" for i in range(count))
+    fields = "\n".join(f"        i{i}: issue(number: $n{i}) {{ id title }}" for i in range(count))
+    return (
+        f"query($owner: String!, $repo: String!{params}) {{\n"
+        f"    repository(owner: $owner, name: $repo) {{\n{fields}\n    }}\n}}\n"
+    )
+
+
+def _get_issue_ids(owner: str, repo: str, numbers: list[int]) -> dict[int, dict | None]:
+    """Look up several issues in one request; numbers that don't exist map to None."""
+    variables = {"owner": owner, "repo": repo}
+    variables.update({f"n{i}": number for i, number in enumerate(numbers)})
+
+    # A missing issue is an error on its alias under repository; tolerate
+    # those and treat a null repository as the real failure
+    result = graphql_request(_issue_ids_query(len(numbers)), variables, tolerate=("repository",))
+    repository = result.get("repository")
+    if not repository:
+        raise ValueError(f"Could not find repository: {owner}/{repo}")
+
+    return {number: repository.get(f"i{i}") for i, number in enumerate(numbers)}
+
+
 def github_auth_status() -> dict:
     """Check GitHub authentication status."""
     if gh_available():
@@ -219,17 +562,17 @@ def register_github_tools(mcp):
     """Register GitHub tools with the MCP server."""
 
     @mcp.tool()
-    def github_auth_check() -> dict:
+    async def github_auth_check() -> dict:
         """
         Check GitHub authentication status.
 
         Returns whether taskr can access GitHub and which auth method is being used.
         Recommended: Use `gh auth login` for secure, browser-based authentication.
         """
-        return github_auth_status()
+        return await asyncio.to_thread(github_auth_status)
 
     @mcp.tool()
-    def github_project_create(title: str, org: str) -> dict:
+    async def github_project_create(title: str, org: str) -> dict:
         """
         Create a GitHub Project v2.
 
@@ -243,22 +586,9 @@ def register_github_tools(mcp):
             Project details including id, number, title, and url
         """
         try:
-            owner_id, _ = get_owner_id(org)
+            owner_id, _ = await asyncio.to_thread(get_owner_id, org)
 
-            mutation = """
-            mutation($ownerId: ID!, $title: String!) {
-                createProjectV2(input: { ownerId: $ownerId, title: $title }) {
-                    projectV2 {
-                        id
-                        number
-                        title
-                        url
-                    }
-                }
-            }
-            """
-
-            result = graphql_request(mutation, {"ownerId": owner_id, "title": title})
+            result = await asyncio.to_thread(graphql_request, _CREATE_PROJECT_MUTATION, {"ownerId": owner_id, "title": title})
             project = result["createProjectV2"]["projectV2"]
 
             return {
@@ -271,7 +601,7 @@ def register_github_tools(mcp):
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_project_add_item(project_id: str, content_id: str) -> dict:
+    async def github_project_add_item(project_id: str, content_id: str) -> dict:
         """
         Add an issue or PR to a GitHub Project v2.
 
@@ -283,23 +613,13 @@ def register_github_tools(mcp):
             Project item details
         """
         try:
-            mutation = """
-            mutation($projectId: ID!, $contentId: ID!) {
-                addProjectV2ItemById(input: { projectId: $projectId, contentId: $contentId }) {
-                    item {
-                        id
-                    }
-                }
-            }
-            """
-
-            result = graphql_request(mutation, {"projectId": project_id, "contentId": content_id})
+            result = await asyncio.to_thread(graphql_request, _ADD_PROJECT_ITEM_MUTATION, {"projectId": project_id, "contentId": content_id})
             return {"item_id": result["addProjectV2ItemById"]["item"]["id"]}
         except Exception as e:
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_get_issue_id(owner: str, repo: str, issue_number: int) -> dict:
+    async def github_get_issue_id(owner: str, repo: str, issue_number: int) -> dict:
         """
         Get the node ID for a GitHub issue.
 
@@ -314,29 +634,73 @@ def register_github_tools(mcp):
             Issue node ID and title
         """
         try:
-            query = """
-            query($owner: String!, $repo: String!, $number: Int!) {
-                repository(owner: $owner, name: $repo) {
-                    issue(number: $number) {
-                        id
-                        title
-                    }
-                }
-            }
-            """
+            key = (owner, repo, issue_number)
+            cached = _issue_cache.get(key)
+            if cached is not None:
+                return dict(cached)
 
-            result = graphql_request(query, {"owner": owner, "repo": repo, "number": issue_number})
+            result = await asyncio.to_thread(graphql_request, _ISSUE_ID_QUERY, {"owner": owner, "repo": repo, "number": issue_number})
             issue = result["repository"]["issue"]
 
-            return {
+            response = {
                 "id": issue["id"],
                 "title": issue["title"],
             }
+            _issue_cache.set(key, response)
+            return dict(response)
+        except Exception as e:
+            return {"error": str(e)}
+
+    @mcp.tool()
+    async def github_get_issue_ids(owner: str, repo: str, issue_numbers: list[int]) -> dict:
+        """
+        Get node IDs for several GitHub issues in one round-trip.
+
+        Prefer this over repeated github_get_issue_id calls when adding
+        many issues to a project.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issue_numbers: Issue numbers to look up
+
+        Returns:
+            Node ID and title per issue number, plus any numbers not found
+        """
+        try:
+            issues = {}
+            missing = []
+            for number in dict.fromkeys(issue_numbers):
+                cached = _issue_cache.get((owner, repo, number))
+                if cached is not None:
+                    issues[number] = dict(cached)
+                else:
+                    missing.append(number)
+
+            batches = [
+                missing[i:i + _ISSUE_BATCH_SIZE]
+                for i in range(0, len(missing), _ISSUE_BATCH_SIZE)
+            ]
+            results = await asyncio.gather(*(
+                asyncio.to_thread(_get_issue_ids, owner, repo, batch) for batch in batches
+            ))
+
+            not_found = []
+            for found in results:
+                for number, issue in found.items():
+                    if issue is None:
+                        not_found.append(number)
+                        continue
+                    response = {"id": issue["id"], "title": issue["title"]}
+                    _issue_cache.set((owner, repo, number), response)
+                    issues[number] = dict(response)
+
+            return {"issues": issues, "not_found": not_found}
         except Exception as e:
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_get_org_id(login: str) -> dict:
+    async def github_get_org_id(login: str) -> dict:
         """
         Get the node ID for a GitHub organization or user.
 
@@ -349,13 +713,13 @@ def register_github_tools(mcp):
             Node ID and type (organization or user)
         """
         try:
-            node_id, node_type = get_owner_id(login)
+            node_id, node_type = await asyncio.to_thread(get_owner_id, login)
             return {"id": node_id, "type": node_type}
         except Exception as e:
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_project_close(project_id: str) -> dict:
+    async def github_project_close(project_id: str) -> dict:
         """
         Close a GitHub Project v2.
 
@@ -368,20 +732,7 @@ def register_github_tools(mcp):
             Project details including closed status
         """
         try:
-            mutation = """
-            mutation($projectId: ID!) {
-                updateProjectV2(input: { projectId: $projectId, closed: true }) {
-                    projectV2 {
-                        id
-                        title
-                        closed
-                        url
-                    }
-                }
-            }
-            """
-
-            result = graphql_request(mutation, {"projectId": project_id})
+            result = await asyncio.to_thread(graphql_request, _SET_PROJECT_CLOSED_MUTATION, {"projectId": project_id, "closed": True})
             project = result["updateProjectV2"]["projectV2"]
 
             return {
@@ -394,7 +745,7 @@ def register_github_tools(mcp):
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_project_reopen(project_id: str) -> dict:
+    async def github_project_reopen(project_id: str) -> dict:
         """
         Reopen a closed GitHub Project v2.
 
@@ -405,20 +756,7 @@ def register_github_tools(mcp):
             Project details including closed status
         """
         try:
-            mutation = """
-            mutation($projectId: ID!) {
-                updateProjectV2(input: { projectId: $projectId, closed: false }) {
-                    projectV2 {
-                        id
-                        title
-                        closed
-                        url
-                    }
-                }
-            }
-            """
-
-            result = graphql_request(mutation, {"projectId": project_id})
+            result = await asyncio.to_thread(graphql_request, _SET_PROJECT_CLOSED_MUTATION, {"projectId": project_id, "closed": False})
             project = result["updateProjectV2"]["projectV2"]
 
             return {
@@ -431,7 +769,7 @@ def register_github_tools(mcp):
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_create_issue_in_project(
+    async def github_create_issue_in_project(
         owner: str,
         repo: str,
         title: str,
@@ -459,8 +797,9 @@ def register_github_tools(mcp):
             Issue details including number, url, and project item id
         """
         try:
-            # Step 1: Create the issue using gh CLI or REST API
-            if gh_available():
+            # Step 1: Create the issue via the REST API, or gh CLI without a token
+            token = await asyncio.to_thread(_get_token)
+            if not token and gh_available():
                 # Use gh issue create
                 cmd = [
                     "issue", "create",
@@ -477,31 +816,17 @@ def register_github_tools(mcp):
                         cmd.extend(["--assignee", assignee])
 
                 # Get the issue URL from gh output
-                result = subprocess.run(
-                    ["gh"] + cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if result.returncode != 0:
-                    raise ValueError(f"gh issue create failed: {result.stderr}")
+                returncode, stdout, stderr = await _run_gh(cmd)
+                if returncode != 0:
+                    raise ValueError(f"gh issue create failed: {stderr}")
 
-                issue_url = result.stdout.strip()
-                # Extract issue number from URL
-                issue_number = int(issue_url.split("/")[-1])
+                issue_url = stdout.strip()
+                issue_number = _number_from_url(issue_url)
+                issue_node_id = None
             else:
-                # Fallback to REST API
-                import httpx
-                token = _get_token()
                 if not token:
                     return {"error": "GitHub authentication required. Run: gh auth login"}
 
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                }
-
                 issue_data = {"title": title}
                 if body:
                     issue_data["body"] = body
@@ -510,41 +835,17 @@ def register_github_tools(mcp):
                 if assignees:
                     issue_data["assignees"] = assignees
 
-                response = httpx.post(
-                    f"https://api.github.com/repos/{owner}/{repo}/issues",
-                    headers=headers,
-                    json=issue_data,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                issue = response.json()
+                issue = await asyncio.to_thread(_api_post, f"/repos/{owner}/{repo}/issues", token, issue_data)
                 issue_number = issue["number"]
                 issue_url = issue["html_url"]
+                issue_node_id = issue["node_id"]
 
-            # Step 2: Get the issue's node ID via GraphQL
-            query = """
-            query($owner: String!, $repo: String!, $number: Int!) {
-                repository(owner: $owner, name: $repo) {
-                    issue(number: $number) {
-                        id
-                    }
-                }
-            }
-            """
-            result = graphql_request(query, {"owner": owner, "repo": repo, "number": issue_number})
-            issue_node_id = result["repository"]["issue"]["id"]
+            # Step 2: Get the issue's node ID via GraphQL (REST already returned it)
+            if issue_node_id is None:
+                issue_node_id = await asyncio.to_thread(_get_issue_node_id, owner, repo, issue_number)
 
             # Step 3: Add the issue to the project
-            mutation = """
-            mutation($projectId: ID!, $contentId: ID!) {
-                addProjectV2ItemById(input: { projectId: $projectId, contentId: $contentId }) {
-                    item {
-                        id
-                    }
-                }
-            }
-            """
-            result = graphql_request(mutation, {"projectId": project_id, "contentId": issue_node_id})
+            result = await asyncio.to_thread(graphql_request, _ADD_PROJECT_ITEM_MUTATION, {"projectId": project_id, "contentId": issue_node_id})
             project_item_id = result["addProjectV2ItemById"]["item"]["id"]
 
             return {
@@ -558,7 +859,7 @@ def register_github_tools(mcp):
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_project_items(
+    async def github_project_items(
         org: str,
         project_number: int,
         status: Optional[str] = None,
@@ -574,84 +875,67 @@ def register_github_tools(mcp):
             org: Organization or user login
             project_number: Project number (e.g., 1)
             status: Optional filter by status name (e.g., 'Todo', 'In Progress', 'Done')
-            limit: Max items to return (default 50)
+            limit: Max items to return (default 50); pages past 100 are followed
 
         Returns:
             Lean list of project items
         """
         try:
-            query = """
-            query($org: String!, $number: Int!, $first: Int!) {
-                organization(login: $org) {
-                    projectV2(number: $number) {
-                        id
-                        title
-                        items(first: $first) {
-                            nodes {
-                                id
-                                fieldValueByName(name: "Status") {
-                                    ... on ProjectV2ItemFieldSingleSelectValue {
-                                        name
-                                    }
-                                }
-                                content {
-                                    ... on Issue {
-                                        number
-                                        title
-                                        state
-                                    }
-                                    ... on PullRequest {
-                                        number
-                                        title
-                                        state
-                                    }
-                                    ... on DraftIssue {
-                                        title
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-            """
-
-            result = graphql_request(query, {"org": org, "number": project_number, "first": min(limit, 100)})
-
-            project = result.get("organization", {}).get("projectV2")
-            if not project:
-                # Try as user instead of org
-                user_query = query.replace("organization(login: $org)", "user(login: $org)")
-                result = graphql_request(user_query, {"org": org, "number": project_number, "first": min(limit, 100)})
-                project = result.get("user", {}).get("projectV2")
+            wanted_status = status.casefold() if status else None
+            project = None
+            items = []
+            after = None
+
+            # Cursors are sequential, so pages are fetched one after another
+            while True:
+                # A status filter drops items, so read full pages
+                first = 100 if wanted_status else min(limit - len(items), 100)
+                result = await asyncio.to_thread(
+                    graphql_request,
+                    _PROJECT_ITEMS_QUERY,
+                    {"login": org, "number": project_number, "first": first, "after": after},
+                    tolerate=("org", "usr"),
+                )
+                page = (result.get("org") or result.get("usr") or {}).get("projectV2")
+                if not page:
+                    break
+                project = project or page
+
+                for node in page["items"]["nodes"]:
+                    if len(items) >= limit:
+                        break
+                    status_field = node.get("fieldValueByName") or {}
+                    item_status = status_field.get("name", "No Status")
+
+                    # Filter by status before touching the item's content
+                    if wanted_status and item_status.casefold() != wanted_status:
+                        continue
+
+                    content = node.get("content") or {}
+                    number = content.get("number")
+
+                    # Determine item type
+                    item_type = "draft"
+                    if "state" in content:
+                        item_type = "issue" if number else "pr"
+
+                    items.append({
+                        "item_id": node["id"],
+                        "number": number,
+                        "title": content.get("title", "Untitled"),
+                        "status": item_status,
+                        "state": content.get("state", "DRAFT"),
+                        "type": item_type,
+                    })
+
+                page_info = page["items"]["pageInfo"]
+                if len(items) >= limit or not page_info["hasNextPage"]:
+                    break
+                after = page_info["endCursor"]
 
             if not project:
                 return {"error": f"Project #{project_number} not found for {org}"}
 
-            items = []
-            for node in project["items"]["nodes"]:
-                content = node.get("content") or {}
-                status_field = node.get("fieldValueByName") or {}
-                item_status = status_field.get("name", "No Status")
-
-                # Filter by status if specified
-                if status and item_status.lower() != status.lower():
-                    continue
-
-                # Determine item type
-                item_type = "draft"
-                if "state" in content:
-                    item_type = "issue" if content.get("number") else "pr"
-
-                items.append({
-                    "item_id": node["id"],
-                    "number": content.get("number"),
-                    "title": content.get("title", "Untitled"),
-                    "status": item_status,
-                    "state": content.get("state", "DRAFT"),
-                    "type": item_type,
-                })
-
             return {
                 "project_id": project["id"],
                 "project_title": project["title"],
@@ -662,7 +946,7 @@ def register_github_tools(mcp):
             return {"error": str(e)}
 
     @mcp.tool()
-    def github_pr_create(
+    async def github_pr_create(
         owner: str,
         repo: str,
         title: str,
@@ -705,8 +989,9 @@ def register_github_tools(mcp):
 
             pr_body += "\n\n---\n*Created with [taskr](https://github.com/rhea-impact/taskr)*"
 
-            # Create the PR using gh CLI or REST API
-            if gh_available():
+            # Create the PR via the REST API, or gh CLI without a token
+            token = await asyncio.to_thread(_get_token)
+            if not token and gh_available():
                 cmd = [
                     "pr", "create",
                     "--repo", f"{owner}/{repo}",
@@ -718,30 +1003,17 @@ def register_github_tools(mcp):
                 if draft:
                     cmd.append("--draft")
 
-                result = subprocess.run(
-                    ["gh"] + cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if result.returncode != 0:
-                    raise ValueError(f"gh pr create failed: {result.stderr}")
+                returncode, stdout, stderr = await _run_gh(cmd)
+                if returncode != 0:
+                    raise ValueError(f"gh pr create failed: {stderr}")
 
-                pr_url = result.stdout.strip()
-                pr_number = int(pr_url.split("/")[-1])
+                pr_url = stdout.strip()
+                pr_number = _number_from_url(pr_url)
+                pr_node_id = None
             else:
-                # Fallback to REST API
-                import httpx
-                token = _get_token()
                 if not token:
                     return {"error": "GitHub authentication required. Run: gh auth login"}
 
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                }
-
                 pr_data = {
                     "title": title,
                     "head": head,
@@ -750,16 +1022,10 @@ def register_github_tools(mcp):
                     "draft": draft,
                 }
 
-                response = httpx.post(
-                    f"https://api.github.com/repos/{owner}/{repo}/pulls",
-                    headers=headers,
-                    json=pr_data,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                pr = response.json()
+                pr = await asyncio.to_thread(_api_post, f"/repos/{owner}/{repo}/pulls", token, pr_data)
                 pr_number = pr["number"]
                 pr_url = pr["html_url"]
+                pr_node_id = pr["node_id"]
 
             result = {
                 "pr_number": pr_number,
@@ -771,52 +1037,25 @@ def register_github_tools(mcp):
             # If issue specified and add_to_project, find the issue's project and add PR
             if issue and add_to_project:
                 try:
-                    # Get PR node ID
-                    pr_query = """
-                    query($owner: String!, $repo: String!, $number: Int!) {
-                        repository(owner: $owner, name: $repo) {
-                            pullRequest(number: $number) {
-                                id
-                            }
-                        }
-                    }
-                    """
-                    pr_result = graphql_request(pr_query, {"owner": owner, "repo": repo, "number": pr_number})
-                    pr_node_id = pr_result["repository"]["pullRequest"]["id"]
-
-                    # Get issue's project items
-                    issue_query = """
-                    query($owner: String!, $repo: String!, $number: Int!) {
-                        repository(owner: $owner, name: $repo) {
-                            issue(number: $number) {
-                                projectItems(first: 1) {
-                                    nodes {
-                                        project {
-                                            id
-                                            title
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    """
-                    issue_result = graphql_request(issue_query, {"owner": owner, "repo": repo, "number": issue})
-                    project_items = issue_result["repository"]["issue"]["projectItems"]["nodes"]
+                    # One round-trip for the issue's project and, unless REST
+                    # already returned it, the PR's node ID
+                    lookup = await asyncio.to_thread(graphql_request, _PR_PROJECT_LOOKUP_QUERY, {
+                        "owner": owner,
+                        "repo": repo,
+                        "prNum": pr_number,
+                        "issueNum": issue,
+                        "needPr": pr_node_id is None,
+                    })
+                    if pr_node_id is None:
+                        pr_node_id = lookup["repository"]["pullRequest"]["id"]
+                    project_items = lookup["repository"]["issue"]["projectItems"]["nodes"]
 
                     if project_items:
                         project_id = project_items[0]["project"]["id"]
                         project_title = project_items[0]["project"]["title"]
 
                         # Add PR to the project
-                        add_mutation = """
-                        mutation($projectId: ID!, $contentId: ID!) {
-                            addProjectV2ItemById(input: { projectId: $projectId, contentId: $contentId }) {
-                                item { id }
-                            }
-                        }
-                        """
-                        graphql_request(add_mutation, {"projectId": project_id, "contentId": pr_node_id})
+                        await asyncio.to_thread(graphql_request, _ADD_PROJECT_ITEM_MUTATION, {"projectId": project_id, "contentId": pr_node_id})
                         result["added_to_project"] = project_title
                         result["message"] += f" and added to project '{project_title}'"
 
@@ -3,17 +3,10 @@ Pytest configuration and fixtures for taskr tests.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
 # Configure pytest-asyncio
 pytest_plugins = ["pytest_asyncio"]
 
-# Add packages to path for testing
-packages_dir = Path(__file__).parent.parent / "packages"
-sys.path.insert(0, str(packages_dir / "taskr-core"))
-sys.path.insert(0, str(packages_dir / "taskr-mcp"))
-
 
 @pytest.fixture
 def temp_config_dir(tmp_path):
@@ -23,6 +16,14 @@ def temp_config_dir(tmp_path):
     return config_dir
 
 
+@pytest.fixture(scope="session")
+def default_config():
+    """A TaskrConfig with every default; shared, so tests must not mutate it."""
+    from taskr.config import TaskrConfig
+
+    return TaskrConfig()
+
+
 @pytest.fixture
 def sample_task_data():
     """Sample task data for testing."""
@@ -0,0 +1,44 @@
+"""
+Tests for the in-process TTL cache.
+"""
+
+from unittest.mock import patch
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_set(self):
+        """Test stored values are returned until evicted."""
+        from taskr.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is dropped when full."""
+        from taskr.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_entries_expire(self):
+        """Test entries are not returned after their TTL."""
+        from taskr.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=1)
+        with patch("taskr.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("taskr.cache.time.monotonic", return_value=102.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
@@ -8,15 +8,20 @@ import tempfile
 import os
 
 
-def test_default_config():
+def test_default_config(default_config):
     """Test default configuration values."""
-    from taskr.config import TaskrConfig, DatabaseConfig, IdentityConfig
+    assert default_config.database.type == "sqlite"
+    assert default_config.database.sqlite_path == "~/.taskr/taskr.db"
+    assert default_config.identity.agent_id == "claude-code"
 
-    config = TaskrConfig()
 
-    assert config.database.type == "sqlite"
-    assert config.database.sqlite_path == "~/.taskr/taskr.db"
-    assert config.identity.agent_id == "claude-code"
+def test_to_dict_does_not_mutate_config(default_config):
+    """Test to_dict leaves the shared default config untouched."""
+    from taskr.config import TaskrConfig
+
+    default_config.to_dict()
+
+    assert default_config == TaskrConfig()
 
 
 def test_load_config_without_file():
@@ -61,3 +66,24 @@ def test_config_to_dict_masks_secrets():
     # URL should be masked
     assert "secretpassword" not in str(result)
     assert "..." in result["database"]["postgres_url"]
+
+
+def test_load_config_postgres_pool_sizes():
+    """Test pool sizes are read from the postgres section."""
+    from taskr.config import load_config
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = Path(tmpdir) / "config.yaml"
+        config_file.write_text(
+            "database:\n"
+            "  type: postgres\n"
+            "  postgres:\n"
+            "    url: postgresql://localhost/db\n"
+            "    pool_min_size: 2\n"
+            "    pool_max_size: 20\n"
+        )
+
+        config = load_config(config_file)
+
+    assert config.database.postgres_pool_min == 2
+    assert config.database.postgres_pool_max == 20
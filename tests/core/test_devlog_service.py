@@ -2,50 +2,58 @@
 Tests for Devlog Service.
 """
 
+import asyncio
+
 import pytest
-import tempfile
-from pathlib import Path
-
-
-@pytest.fixture
-async def devlog_service_with_db():
-    """Create a DevlogService with a temporary SQLite database."""
-    from taskr.db.sqlite import SQLiteAdapter
-    from taskr.services.devlogs import DevlogService
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        adapter = SQLiteAdapter(str(db_path))
-        await adapter.connect()
-
-        # Create devlogs table
-        await adapter.execute("""
-            CREATE TABLE devlogs (
-                id TEXT PRIMARY KEY,
-                category TEXT NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                author TEXT,
-                agent_id TEXT DEFAULT 'claude-code',
-                service_name TEXT,
-                tags TEXT DEFAULT '[]',
-                metadata TEXT DEFAULT '{}',
-                created_at TEXT,
-                updated_at TEXT,
-                deleted_at TEXT
-            )
-        """)
+import pytest_asyncio
+from unittest.mock import patch
+
+from taskr.db.sqlite import SQLiteAdapter
+from taskr.services.devlogs import DevlogService
+
+# Tests share one event loop so they can share the module's database
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def devlog_db():
+    """One in-memory SQLite database with a devlogs table, shared by every test here."""
+    # Nothing here needs durability, so commits never touch the disk
+    adapter = SQLiteAdapter(":memory:")
+    await adapter.connect()
+
+    await adapter.execute("""
+        CREATE TABLE devlogs (
+            id TEXT PRIMARY KEY,
+            category TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            author TEXT,
+            agent_id TEXT DEFAULT 'claude-code',
+            service_name TEXT,
+            tags TEXT DEFAULT '[]',
+            metadata TEXT DEFAULT '{}',
+            created_at TEXT,
+            updated_at TEXT,
+            deleted_at TEXT
+        )
+    """)
+
+    yield adapter
+
+    await adapter.close()
 
-        service = DevlogService(adapter=adapter)
-        yield service
 
-        await adapter.close()
+@pytest_asyncio.fixture(loop_scope="module")
+async def devlog_service_with_db(devlog_db):
+    """Create a DevlogService over the shared database, emptied for this test."""
+    await devlog_db.execute("DELETE FROM devlogs")
+    return DevlogService(adapter=devlog_db)
 
 
 class TestDevlogServiceAdd:
     """Tests for DevlogService.add()."""
 
-    @pytest.mark.asyncio
     async def test_add_devlog_minimal(self, devlog_service_with_db):
         """Test adding a devlog with minimal data."""
         service = devlog_service_with_db
@@ -61,7 +69,6 @@ class TestDevlogServiceAdd:
         assert devlog.content == "This is a test note."
         assert devlog.id is not None
 
-    @pytest.mark.asyncio
     async def test_add_devlog_full(self, devlog_service_with_db):
         """Test adding a devlog with all fields."""
         service = devlog_service_with_db
@@ -85,7 +92,6 @@ class TestDevlogServiceAdd:
         assert devlog.tags == ["architecture", "database"]
         assert devlog.metadata == {"confidence": "high"}
 
-    @pytest.mark.asyncio
     async def test_add_devlog_invalid_category(self, devlog_service_with_db):
         """Test that invalid category raises error."""
         service = devlog_service_with_db
@@ -99,7 +105,6 @@ class TestDevlogServiceAdd:
 
         assert "Invalid category" in str(exc.value)
 
-    @pytest.mark.asyncio
     async def test_add_devlog_all_valid_categories(self, devlog_service_with_db):
         """Test that all valid categories work."""
         service = devlog_service_with_db
@@ -108,19 +113,58 @@ class TestDevlogServiceAdd:
             "refactor", "research", "decision", "migration", "note"
         ]
 
-        for category in valid_categories:
-            devlog = await service.add(
+        devlogs = await asyncio.gather(*(
+            service.add(
                 category=category,
                 title=f"Test {category}",
                 content=f"Content for {category}",
             )
-            assert devlog.category == category
+            for category in valid_categories
+        ))
+
+        assert [devlog.category for devlog in devlogs] == valid_categories
+        assert len(await service.list(limit=20)) == len(valid_categories)
+
+
+class TestDevlogServiceAddMany:
+    """Tests for DevlogService.add_many()."""
+
+    async def test_add_many(self, devlog_service_with_db):
+        """Test adding several devlogs in one batch."""
+        service = devlog_service_with_db
+
+        added = await service.add_many([
+            {"category": "note", "title": "First", "content": "One"},
+            {"category": "decision", "title": "Second", "content": "Two", "tags": ["batch"]},
+        ])
+
+        assert [d.title for d in added] == ["First", "Second"]
+        fetched = await service.get(added[1].id)
+        assert fetched.category == "decision"
+        assert fetched.tags == ["batch"]
+
+    async def test_add_many_invalid_item_inserts_nothing(self, devlog_service_with_db):
+        """Test that validation fails before any row is written."""
+        service = devlog_service_with_db
+
+        for item in (
+            {"category": "bogus", "title": "Bad", "content": "x"},
+            {"category": "note", "content": "no title"},
+            {"category": "note", "title": "Typo", "content": "x", "tagz": []},
+        ):
+            with pytest.raises(ValueError, match="Devlog 1"):
+                await service.add_many([{"category": "note", "title": "Ok", "content": "x"}, item])
+
+        assert await service.list() == []
+
+    async def test_add_many_empty(self, devlog_service_with_db):
+        """Test that an empty batch is a no-op."""
+        assert await devlog_service_with_db.add_many([]) == []
 
 
 class TestDevlogServiceGet:
     """Tests for DevlogService.get()."""
 
-    @pytest.mark.asyncio
     async def test_get_existing_devlog(self, devlog_service_with_db):
         """Test getting an existing devlog."""
         service = devlog_service_with_db
@@ -136,7 +180,6 @@ class TestDevlogServiceGet:
         assert fetched.id == created.id
         assert fetched.title == "Test"
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_devlog(self, devlog_service_with_db):
         """Test getting a devlog that doesn't exist."""
         service = devlog_service_with_db
@@ -145,7 +188,6 @@ class TestDevlogServiceGet:
 
         assert fetched is None
 
-    @pytest.mark.asyncio
     async def test_get_deleted_devlog_returns_none(self, devlog_service_with_db):
         """Test that soft-deleted devlogs are not returned."""
         service = devlog_service_with_db
@@ -164,7 +206,6 @@ class TestDevlogServiceGet:
 class TestDevlogServiceUpdate:
     """Tests for DevlogService.update()."""
 
-    @pytest.mark.asyncio
     async def test_update_title(self, devlog_service_with_db):
         """Test updating devlog title."""
         service = devlog_service_with_db
@@ -178,7 +219,6 @@ class TestDevlogServiceUpdate:
 
         assert updated.title == "Updated"
 
-    @pytest.mark.asyncio
     async def test_update_content(self, devlog_service_with_db):
         """Test updating devlog content."""
         service = devlog_service_with_db
@@ -192,7 +232,6 @@ class TestDevlogServiceUpdate:
 
         assert updated.content == "Updated content"
 
-    @pytest.mark.asyncio
     async def test_update_category(self, devlog_service_with_db):
         """Test updating devlog category."""
         service = devlog_service_with_db
@@ -206,7 +245,6 @@ class TestDevlogServiceUpdate:
 
         assert updated.category == "decision"
 
-    @pytest.mark.asyncio
     async def test_update_tags(self, devlog_service_with_db):
         """Test updating devlog tags."""
         service = devlog_service_with_db
@@ -221,7 +259,6 @@ class TestDevlogServiceUpdate:
 
         assert updated.tags == ["new-tag", "another-tag"]
 
-    @pytest.mark.asyncio
     async def test_update_invalid_category(self, devlog_service_with_db):
         """Test that invalid category raises error."""
         service = devlog_service_with_db
@@ -239,7 +276,6 @@ class TestDevlogServiceUpdate:
 class TestDevlogServiceList:
     """Tests for DevlogService.list()."""
 
-    @pytest.mark.asyncio
     async def test_list_empty(self, devlog_service_with_db):
         """Test listing when no devlogs exist."""
         service = devlog_service_with_db
@@ -248,26 +284,28 @@ class TestDevlogServiceList:
 
         assert devlogs == []
 
-    @pytest.mark.asyncio
     async def test_list_returns_devlogs(self, devlog_service_with_db):
         """Test listing devlogs."""
         service = devlog_service_with_db
 
-        await service.add(category="note", title="Note 1", content="Content 1")
-        await service.add(category="note", title="Note 2", content="Content 2")
+        await asyncio.gather(
+            service.add(category="note", title="Note 1", content="Content 1"),
+            service.add(category="note", title="Note 2", content="Content 2"),
+        )
 
         devlogs = await service.list()
 
         assert len(devlogs) == 2
 
-    @pytest.mark.asyncio
     async def test_list_filter_by_category(self, devlog_service_with_db):
         """Test filtering by category."""
         service = devlog_service_with_db
 
-        await service.add(category="note", title="Note", content="Content")
-        await service.add(category="decision", title="Decision", content="Content")
-        await service.add(category="bugfix", title="Bugfix", content="Content")
+        await asyncio.gather(
+            service.add(category="note", title="Note", content="Content"),
+            service.add(category="decision", title="Decision", content="Content"),
+            service.add(category="bugfix", title="Bugfix", content="Content"),
+        )
 
         notes = await service.list(category="note")
         decisions = await service.list(category="decision")
@@ -277,22 +315,23 @@ class TestDevlogServiceList:
         assert len(decisions) == 1
         assert decisions[0].title == "Decision"
 
-    @pytest.mark.asyncio
     async def test_list_filter_by_service_name(self, devlog_service_with_db):
         """Test filtering by service name."""
         service = devlog_service_with_db
 
-        await service.add(
-            category="note",
-            title="API note",
-            content="Content",
-            service_name="backend-api",
-        )
-        await service.add(
-            category="note",
-            title="Frontend note",
-            content="Content",
-            service_name="frontend",
+        await asyncio.gather(
+            service.add(
+                category="note",
+                title="API note",
+                content="Content",
+                service_name="backend-api",
+            ),
+            service.add(
+                category="note",
+                title="Frontend note",
+                content="Content",
+                service_name="frontend",
+            ),
         )
 
         api_logs = await service.list(service_name="backend-api")
@@ -300,22 +339,23 @@ class TestDevlogServiceList:
         assert len(api_logs) == 1
         assert api_logs[0].title == "API note"
 
-    @pytest.mark.asyncio
     async def test_list_filter_by_author(self, devlog_service_with_db):
         """Test filtering by author."""
         service = devlog_service_with_db
 
-        await service.add(
-            category="note",
-            title="Alice note",
-            content="Content",
-            author="alice",
-        )
-        await service.add(
-            category="note",
-            title="Bob note",
-            content="Content",
-            author="bob",
+        await asyncio.gather(
+            service.add(
+                category="note",
+                title="Alice note",
+                content="Content",
+                author="alice",
+            ),
+            service.add(
+                category="note",
+                title="Bob note",
+                content="Content",
+                author="bob",
+            ),
         )
 
         alice_logs = await service.list(author="alice")
@@ -323,25 +363,43 @@ class TestDevlogServiceList:
         assert len(alice_logs) == 1
         assert alice_logs[0].title == "Alice note"
 
-    @pytest.mark.asyncio
+    async def test_list_filter_by_tags(self, devlog_service_with_db):
+        """Test filtering by tags matches any listed tag exactly."""
+        service = devlog_service_with_db
+
+        await asyncio.gather(
+            service.add(category="note", title="DB", content="Content", tags=["database"]),
+            service.add(category="note", title="API", content="Content", tags=["api", "auth"]),
+            service.add(category="note", title="Other", content="Content", tags=["data"]),
+        )
+
+        tagged = await service.list(tags=["database", "auth"])
+        quoted = await service.list(tags=["x' OR '1'='1"])
+
+        assert {d.title for d in tagged} == {"DB", "API"}
+        assert quoted == []
+
     async def test_list_respects_limit(self, devlog_service_with_db):
         """Test that limit is respected."""
         service = devlog_service_with_db
 
-        for i in range(10):
-            await service.add(category="note", title=f"Note {i}", content=f"Content {i}")
+        await service.add_many([
+            {"category": "note", "title": f"Note {i}", "content": f"Content {i}"}
+            for i in range(10)
+        ])
 
         devlogs = await service.list(limit=3)
 
         assert len(devlogs) == 3
 
-    @pytest.mark.asyncio
     async def test_list_excludes_deleted(self, devlog_service_with_db):
         """Test that deleted devlogs are excluded."""
         service = devlog_service_with_db
 
-        created = await service.add(category="note", title="To delete", content="Content")
-        await service.add(category="note", title="To keep", content="Content")
+        created, _ = await asyncio.gather(
+            service.add(category="note", title="To delete", content="Content"),
+            service.add(category="note", title="To keep", content="Content"),
+        )
         await service.delete(created.id)
 
         devlogs = await service.list()
@@ -353,20 +411,21 @@ class TestDevlogServiceList:
 class TestDevlogServiceSearch:
     """Tests for DevlogService.search()."""
 
-    @pytest.mark.asyncio
     async def test_search_by_title(self, devlog_service_with_db):
         """Test searching by title."""
         service = devlog_service_with_db
 
-        await service.add(
-            category="decision",
-            title="Database selection decision",
-            content="We chose PostgreSQL",
-        )
-        await service.add(
-            category="note",
-            title="Meeting notes",
-            content="Discussed timelines",
+        await asyncio.gather(
+            service.add(
+                category="decision",
+                title="Database selection decision",
+                content="We chose PostgreSQL",
+            ),
+            service.add(
+                category="note",
+                title="Meeting notes",
+                content="Discussed timelines",
+            ),
         )
 
         results = await service.search("database")
@@ -374,20 +433,21 @@ class TestDevlogServiceSearch:
         assert len(results) == 1
         assert results[0].title == "Database selection decision"
 
-    @pytest.mark.asyncio
     async def test_search_by_content(self, devlog_service_with_db):
         """Test searching by content."""
         service = devlog_service_with_db
 
-        await service.add(
-            category="bugfix",
-            title="Fix login bug",
-            content="The authentication token was expiring too early",
-        )
-        await service.add(
-            category="note",
-            title="General note",
-            content="Nothing important here",
+        await asyncio.gather(
+            service.add(
+                category="bugfix",
+                title="Fix login bug",
+                content="The authentication token was expiring too early",
+            ),
+            service.add(
+                category="note",
+                title="General note",
+                content="Nothing important here",
+            ),
         )
 
         results = await service.search("authentication")
@@ -395,20 +455,21 @@ class TestDevlogServiceSearch:
         assert len(results) == 1
         assert results[0].title == "Fix login bug"
 
-    @pytest.mark.asyncio
     async def test_search_with_category_filter(self, devlog_service_with_db):
         """Test search with category filter."""
         service = devlog_service_with_db
 
-        await service.add(
-            category="decision",
-            title="Auth decision",
-            content="Use JWT tokens",
-        )
-        await service.add(
-            category="bugfix",
-            title="Auth bugfix",
-            content="Fixed token refresh",
+        await asyncio.gather(
+            service.add(
+                category="decision",
+                title="Auth decision",
+                content="Use JWT tokens",
+            ),
+            service.add(
+                category="bugfix",
+                title="Auth bugfix",
+                content="Fixed token refresh",
+            ),
         )
 
         results = await service.search("auth", category="decision")
@@ -416,11 +477,65 @@ class TestDevlogServiceSearch:
         assert len(results) == 1
         assert results[0].title == "Auth decision"
 
+    async def test_search_with_category_list(self, devlog_service_with_db):
+        """Test a category list matches any of the categories in one search."""
+        service = devlog_service_with_db
+
+        await asyncio.gather(
+            service.add(category="bugfix", title="Auth bugfix", content="x"),
+            service.add(category="incident", title="Auth outage", content="x"),
+            service.add(category="note", title="Auth note", content="x"),
+        )
+
+        results = await service.search("auth", category=["bugfix", "incident"])
+
+        assert {d.title for d in results} == {"Auth bugfix", "Auth outage"}
+
+    async def test_search_filters_are_parameterized(self, devlog_service_with_db):
+        """Test category and service filters are bound as parameters."""
+        service = devlog_service_with_db
+
+        await asyncio.gather(
+            service.add(category="note", title="Auth note", content="x", service_name="api"),
+            service.add(category="note", title="Auth other", content="x", service_name="web"),
+        )
+
+        results = await service.search("auth", category="note", service_name="api")
+        injected = await service.search("auth", service_name="x' OR '1'='1")
+
+        assert [d.title for d in results] == ["Auth note"]
+        assert injected == []
+
+    async def test_search_is_cached_until_write(self, devlog_service_with_db):
+        """Test repeated searches hit memory and writes clear the cache."""
+        service = devlog_service_with_db
+        await service.add(category="note", title="Auth note", content="x")
+
+        with patch.object(service.adapter, "search_text", wraps=service.adapter.search_text) as search_text:
+            first = await service.search("auth", category=["note"])
+            second = await service.search("auth", category=("note",))
+
+        assert search_text.call_count == 1
+        assert [d.title for d in second] == [d.title for d in first]
+
+        await service.add(category="note", title="Auth followup", content="x")
+        assert len(await service.search("auth", category=["note"])) == 2
+
+    async def test_concurrent_searches_share_one_query(self, devlog_service_with_db):
+        """Test identical concurrent searches are coalesced into one query."""
+        service = devlog_service_with_db
+        await service.add(category="note", title="Auth note", content="x")
+
+        with patch.object(service.adapter, "search_text", wraps=service.adapter.search_text) as search_text:
+            results = await asyncio.gather(*(service.search("auth") for _ in range(5)))
+
+        assert search_text.call_count == 1
+        assert all([d.title for d in r] == ["Auth note"] for r in results)
+
 
 class TestDevlogServiceDelete:
     """Tests for DevlogService.delete()."""
 
-    @pytest.mark.asyncio
     async def test_delete_existing_devlog(self, devlog_service_with_db):
         """Test soft deleting a devlog."""
         service = devlog_service_with_db
@@ -433,7 +548,6 @@ class TestDevlogServiceDelete:
         fetched = await service.get(created.id)
         assert fetched is None
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_devlog(self, devlog_service_with_db):
         """Test deleting a nonexistent devlog."""
         service = devlog_service_with_db
@@ -446,7 +560,6 @@ class TestDevlogServiceDelete:
 class TestDevlogServiceHelpers:
     """Tests for DevlogService helper methods."""
 
-    @pytest.mark.asyncio
     async def test_get_categories(self, devlog_service_with_db):
         """Test getting valid categories."""
         service = devlog_service_with_db
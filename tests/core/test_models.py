@@ -3,7 +3,11 @@ Tests for taskr data models.
 """
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from taskr.models.devlog import Devlog
+from taskr.models.session import Session
+from taskr.models.task import Task
 
 
 class TestTaskModel:
@@ -11,8 +15,6 @@ class TestTaskModel:
 
     def test_task_creation(self):
         """Test creating a task with defaults."""
-        from taskr.models.task import Task
-
         task = Task(title="Test task")
 
         assert task.title == "Test task"
@@ -23,8 +25,6 @@ class TestTaskModel:
 
     def test_task_is_open(self):
         """Test is_open property."""
-        from taskr.models.task import Task
-
         task = Task(title="Test", status="open")
         assert task.is_open is True
 
@@ -36,8 +36,6 @@ class TestTaskModel:
 
     def test_task_to_dict(self):
         """Test serialization to dict."""
-        from taskr.models.task import Task
-
         task = Task(
             title="Test",
             description="Description",
@@ -54,8 +52,6 @@ class TestTaskModel:
 
     def test_task_from_dict(self):
         """Test deserialization from dict."""
-        from taskr.models.task import Task
-
         data = {
             "id": "test-id",
             "title": "Test",
@@ -71,14 +67,22 @@ class TestTaskModel:
         assert task.status == "done"
         assert task.tags == ["tag1", "tag2"]
 
+    def test_task_from_row_matches_from_dict(self):
+        """Test the fast row constructor agrees with from_dict."""
+        row = Task(title="Row", tags=["a"], due_at=datetime(2024, 1, 2)).to_dict()
+        row["tags"] = '["a"]'  # JSON string (SQLite)
+
+        fast = Task.from_row(row)
+
+        assert fast == Task.from_dict(dict(row))
+        assert row["tags"] == '["a"]'  # row left untouched
+
 
 class TestDevlogModel:
     """Tests for Devlog model."""
 
     def test_devlog_creation(self):
         """Test creating a devlog."""
-        from taskr.models.devlog import Devlog
-
         devlog = Devlog(
             category="decision",
             title="Test decision",
@@ -91,17 +95,31 @@ class TestDevlogModel:
 
     def test_devlog_invalid_category(self):
         """Test that invalid category raises error."""
-        from taskr.models.devlog import Devlog
-
         with pytest.raises(ValueError) as exc:
             Devlog(category="invalid", title="Test", content="Content")
 
         assert "Invalid category" in str(exc.value)
 
+    def test_devlog_from_dict_does_not_share_row_state(self):
+        """Test from_dict leaves the row alone and copies tags and metadata."""
+        row = Devlog(
+            title="Row", content="x", tags=["a"], metadata={"nested": {"k": 1}}
+        ).to_dict()
+        created_at = row["created_at"]
+
+        first = Devlog.from_dict(row)
+        first.tags.append("b")
+        first.metadata["nested"]["k"] = 2
+        second = Devlog.from_dict(row)
+
+        assert row["created_at"] == created_at
+        assert row["tags"] == ["a"]
+        assert second.tags == ["a"]
+        assert second.metadata == {"nested": {"k": 1}}
+        assert second.created_at == first.created_at
+
     def test_devlog_summary(self):
         """Test summary generation."""
-        from taskr.models.devlog import Devlog
-
         devlog = Devlog(
             category="note",
             title="Test",
@@ -118,8 +136,6 @@ class TestSessionModel:
 
     def test_session_creation(self):
         """Test creating a session."""
-        from taskr.models.session import Session
-
         session = Session(agent_id="test-agent")
 
         assert session.agent_id == "test-agent"
@@ -128,7 +144,6 @@ class TestSessionModel:
 
     def test_session_duration(self):
         """Test duration calculation."""
-        from taskr.models.session import Session
         from datetime import timedelta
 
         start = datetime.utcnow() - timedelta(hours=1)
@@ -143,3 +158,14 @@ class TestSessionModel:
         duration = session.duration_seconds
         assert duration is not None
         assert 3500 < duration < 3700  # ~1 hour
+
+    def test_session_duration_active_naive_start(self):
+        """Test duration of an active session started with a naive UTC timestamp."""
+        naive_utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+        session = Session(
+            agent_id="test",
+            started_at=naive_utc_now - timedelta(minutes=5),
+        )
+
+        assert session.started_at.tzinfo is None
+        assert 290 < session.duration_seconds < 310
@@ -0,0 +1,59 @@
+"""
+Tests for the shared JSON helpers.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from taskr.db import serialization
+from taskr.db.serialization import json_dumps, json_loads, jsonb_encode
+
+
+class TestJsonHelpers:
+    """Tests for json_dumps/json_loads/jsonb_encode."""
+
+    def test_round_trip(self):
+        """Test values survive a dumps/loads round trip."""
+        value = {"tags": ["a", "b"], "n": 1, "nested": {"ok": True}}
+
+        assert json_loads(json_dumps(value)) == value
+
+    def test_dumps_returns_str(self):
+        """Test dumps returns str whether or not orjson is installed."""
+        assert isinstance(json_dumps(["a"]), str)
+
+    def test_jsonb_encode_encodes_strings(self):
+        """Test str values become JSON strings rather than raw JSON."""
+        assert json_loads(jsonb_encode("hello")) == "hello"
+        assert json_loads(jsonb_encode("1")) == "1"
+        assert json_loads(jsonb_encode({"a": 1})) == {"a": 1}
+
+    def test_loads_none(self):
+        """Test a NULL column value decodes to None."""
+        assert json_loads(None) is None
+
+    def test_dumps_stdlib_path(self):
+        """Test the stdlib path handles non-str keys and big ints."""
+        with patch.object(serialization, "HAS_ORJSON", False):
+            assert json_loads(json_dumps({1: 2**70})) == {"1": 2**70}
+
+    def test_dumps_falls_back_when_orjson_rejects_value(self):
+        """Test values orjson can't encode fall back to the stdlib."""
+        fake_orjson = MagicMock(OPT_NON_STR_KEYS=1)
+        fake_orjson.dumps.side_effect = TypeError("Integer exceeds 64-bit range")
+
+        with patch.object(serialization, "HAS_ORJSON", True), \
+                patch.object(serialization, "orjson", fake_orjson):
+            assert json_dumps({"n": 2**70}) == json.dumps({"n": 2**70})
+
+        assert fake_orjson.dumps.call_args.kwargs["option"] == 1
+
+    def test_dumps_orjson_matches_stdlib_values(self):
+        """Test orjson output decodes to what the stdlib would produce."""
+        pytest.importorskip("orjson")
+        value = {1: "int key", "big": 2**70, "nested": {"ok": True}}
+
+        with patch.object(serialization, "HAS_ORJSON", True):
+            assert json.loads(json_dumps(value)) == json.loads(json.dumps(value))
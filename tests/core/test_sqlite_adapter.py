@@ -135,6 +135,7 @@ async def test_sqlite_features(sqlite_adapter):
     assert sqlite_adapter.supports_jsonb is False
     assert sqlite_adapter.supports_arrays is False
     assert sqlite_adapter.placeholder_style == "qmark"
+    assert sqlite_adapter.kind == "sqlite"
 
 
 @pytest.mark.asyncio
@@ -149,3 +150,81 @@ async def test_sqlite_format_query(sqlite_adapter):
     assert "$1" not in sqlite_query
     assert "$2" not in sqlite_query
     assert "?" in sqlite_query
+
+
+@pytest.mark.asyncio
+async def test_sqlite_executemany(sqlite_adapter):
+    """Test batched inserts."""
+    await sqlite_adapter.executemany(
+        "INSERT INTO test_items (id, name, value) VALUES ($1, $2, $3)",
+        [("a", "A", 1), ("b", "B", 2)],
+    )
+
+    count = await sqlite_adapter.fetchval("SELECT COUNT(*) FROM test_items")
+    assert count == 2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_execute_script(sqlite_adapter):
+    """Test multi-statement scripts, including trigger bodies and quoted semicolons."""
+    await sqlite_adapter.execute_script("""
+        -- comment line
+        CREATE TABLE audit (name TEXT);
+        CREATE TRIGGER tr_items AFTER INSERT ON test_items
+        BEGIN
+            INSERT INTO audit (name) VALUES (NEW.name);
+        END;
+        INSERT INTO test_items (id, name) VALUES ('a', 'semi;colon');
+    """)
+
+    assert await sqlite_adapter.fetchval("SELECT name FROM audit") == "semi;colon"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_core_migrations_apply(sqlite_adapter):
+    """Test the shipped SQLite migrations apply cleanly as scripts."""
+    migrations_dir = Path(__file__).parents[2] / "packages" / "taskr-core" / "migrations" / "sqlite"
+
+    for sql_file in sorted(migrations_dir.glob("*.sql")):
+        await sqlite_adapter.execute_script(sql_file.read_text())
+
+    versions = await sqlite_adapter.fetch("SELECT version FROM schema_migrations")
+    assert {row["version"] for row in versions} >= {"001"}
+
+
+def test_status_rowcount():
+    """Test row counts are parsed from the trailing integer only."""
+    from taskr.db import status_rowcount
+
+    assert status_rowcount("UPDATE 12") == 12
+    assert status_rowcount("UPDATE 0") == 0
+    assert status_rowcount("INSERT 0 1") == 1
+    assert status_rowcount("OK") == 0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_fetch_records(sqlite_adapter):
+    """Test fetch_records falls back to fetch() rows on SQLite."""
+    await sqlite_adapter.execute(
+        "INSERT INTO test_items (id, name, value) VALUES ($1, $2, $3)",
+        "a", "A", 1,
+    )
+
+    rows = await sqlite_adapter.fetch_records("SELECT id, name FROM test_items")
+
+    assert [row["name"] for row in rows] == ["A"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_fetch_limited(sqlite_adapter):
+    """Test fetch_limited stops at max_rows."""
+    await sqlite_adapter.executemany(
+        "INSERT INTO test_items (id, name, value) VALUES ($1, $2, $3)",
+        [(str(i), f"Item {i}", i) for i in range(5)],
+    )
+
+    rows = await sqlite_adapter.fetch_limited(
+        "SELECT * FROM test_items WHERE value >= $1 ORDER BY value", 1, max_rows=2
+    )
+
+    assert [row["value"] for row in rows] == [1, 2]
@@ -2,9 +2,11 @@
 Tests for Task Service.
 """
 
+import asyncio
 import pytest
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -141,6 +143,29 @@ class TestTaskServiceGet:
 class TestTaskServiceUpdate:
     """Tests for TaskService.update()."""
 
+    @pytest.mark.asyncio
+    async def test_update_uses_returning_when_supported(self):
+        """Test adapters with RETURNING get one fetchrow instead of execute + get."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from taskr.models.task import Task
+        from taskr.services.tasks import TaskService
+
+        adapter = MagicMock()
+        adapter.placeholder_style = "dollar"
+        adapter.supports_arrays = True
+        adapter.supports_returning = True
+        row = Task(id="t1", title="Updated").to_dict()
+        adapter.fetchrow = AsyncMock(return_value=row)
+        adapter.execute = AsyncMock()
+
+        updated = await TaskService(adapter=adapter).update("t1", title="Updated")
+
+        assert updated.title == "Updated"
+        adapter.execute.assert_not_called()
+        query = adapter.fetchrow.call_args.args[0]
+        assert "RETURNING id, title" in query
+
     @pytest.mark.asyncio
     async def test_update_title(self, task_service_with_db):
         """Test updating task title."""
@@ -327,6 +352,21 @@ class TestTaskServiceSearch:
         assert len(results) == 1
         assert results[0].title == "Task 1"
 
+    @pytest.mark.asyncio
+    async def test_search_status_is_parameterized(self, task_service_with_db):
+        """Test the status filter is bound as a parameter, not interpolated."""
+        service = task_service_with_db
+
+        await service.create(title="Open auth task")
+        done = await service.create(title="Done auth task")
+        await service.update(done.id, status="done")
+
+        done_results = await service.search("auth", status="done")
+        injected = await service.search("auth", status="x' OR '1'='1")
+
+        assert [t.title for t in done_results] == ["Done auth task"]
+        assert injected == []
+
     @pytest.mark.asyncio
     async def test_search_no_results(self, task_service_with_db):
         """Test search with no matches."""
@@ -389,3 +429,160 @@ class TestTaskServiceHelpers:
 
         assert updated.status == "done"
         assert updated.completed_at is not None
+
+
+class TestTaskServiceCreateMany:
+    """Tests for TaskService.create_many()."""
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, task_service_with_db):
+        """Test creating several tasks in one batch."""
+        service = task_service_with_db
+
+        created = await service.create_many(
+            [
+                {"title": "First"},
+                {"title": "Second", "priority": "high", "tags": ["batch"]},
+            ],
+            created_by="tester",
+        )
+
+        assert [t.title for t in created] == ["First", "Second"]
+        fetched = await service.get(created[1].id)
+        assert fetched.priority == "high"
+        assert fetched.tags == ["batch"]
+        assert fetched.created_by == "tester"
+
+    @pytest.mark.asyncio
+    async def test_create_many_invalid_item_inserts_nothing(self, task_service_with_db):
+        """Test that validation fails before any row is written."""
+        service = task_service_with_db
+
+        with pytest.raises(ValueError):
+            await service.create_many([{"title": "Ok"}, {"title": "Bad", "status": "invalid"}])
+
+        assert await service.list() == []
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, task_service_with_db):
+        """Test that an empty batch is a no-op."""
+        service = task_service_with_db
+
+        assert await service.create_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_create_many_rejects_bad_items(self, task_service_with_db):
+        """Test that missing titles, unknown fields and bad dates raise ValueError."""
+        service = task_service_with_db
+
+        for item in (
+            {"description": "no title"},
+            {"title": "Typo", "prioirty": "high"},
+            {"title": "Bad date", "due_at": "next tuesday"},
+        ):
+            with pytest.raises(ValueError):
+                await service.create_many([item])
+
+        assert await service.list() == []
+
+    @pytest.mark.asyncio
+    async def test_create_many_parses_due_at_string(self, task_service_with_db):
+        """Test that an ISO string due_at (as sent over JSON) is accepted."""
+        service = task_service_with_db
+
+        created = await service.create_many([{"title": "Due", "due_at": "2026-01-02T03:04:05Z"}])
+
+        fetched = await service.get(created[0].id)
+        assert fetched.due_at.year == 2026
+        assert fetched.due_at.utcoffset().total_seconds() == 0
+
+
+class TestTaskServiceDicts:
+    """Tests for the dict-returning list/search fast paths."""
+
+    @pytest.mark.asyncio
+    async def test_list_dicts_matches_to_dict(self, task_service_with_db):
+        """Test list_dicts returns the same shape as Task.to_dict()."""
+        service = task_service_with_db
+
+        await service.create(title="Dict task", tags=["a", "b"])
+
+        tasks = await service.list()
+        dicts = await service.list_dicts()
+
+        assert dicts == [t.to_dict() for t in tasks]
+        assert dicts[0]["tags"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_search_dicts(self, task_service_with_db):
+        """Test search_dicts returns only task columns."""
+        service = task_service_with_db
+
+        await service.create(title="Find this task")
+        await service.create(title="Something else")
+
+        results = await service.search_dicts("Find")
+
+        assert len(results) == 1
+        assert results[0]["title"] == "Find this task"
+        assert set(results[0]) == set((await service.list())[0].to_dict())
+
+
+class TestTaskServiceCache:
+    """Tests for TaskService read caching."""
+
+    @pytest.mark.asyncio
+    async def test_get_is_cached_until_update(self, task_service_with_db):
+        """Test repeated get() hits memory and update() invalidates it."""
+        service = task_service_with_db
+        created = await service.create(title="Cached")
+
+        with patch.object(service.adapter, "fetchrow", wraps=service.adapter.fetchrow) as fetchrow:
+            first = await service.get(created.id)
+            first.title = "mutated locally"
+            second = await service.get(created.id)
+
+        assert fetchrow.call_count == 1
+        assert second.title == "Cached"
+
+        await service.update(created.id, title="Renamed")
+        assert (await service.get(created.id)).title == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_get_racing_update_does_not_cache_stale_row(self, task_service_with_db):
+        """Test a row fetched before a concurrent update() is not cached."""
+        service = task_service_with_db
+        created = await service.create(title="Cached")
+
+        fetchrow = service.adapter.fetchrow
+        fetched, release = asyncio.Event(), asyncio.Event()
+        calls = 0
+
+        async def slow_fetchrow(*args):
+            nonlocal calls
+            calls += 1
+            row = await fetchrow(*args)
+            if calls == 1:
+                # Hold the first read's (old) row until the update has finished
+                fetched.set()
+                await release.wait()
+            return row
+
+        with patch.object(service.adapter, "fetchrow", side_effect=slow_fetchrow):
+            reader = asyncio.create_task(service.get(created.id))
+            await fetched.wait()
+            await service.update(created.id, title="Renamed")
+            release.set()
+            assert (await reader).title == "Cached"
+
+        assert (await service.get(created.id)).title == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_list_sees_new_tasks(self, task_service_with_db):
+        """Test writes invalidate cached list pages."""
+        service = task_service_with_db
+
+        assert await service.list() == []
+        await service.create(title="New")
+
+        assert [t.title for t in await service.list()] == ["New"]
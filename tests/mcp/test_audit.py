@@ -0,0 +1,107 @@
+"""
+Tests for the buffered SQL audit writer.
+"""
+
+import asyncio
+
+import pytest
+
+from taskr_mcp.audit import AuditLogWriter
+
+
+@pytest.fixture
+async def audit_adapter(tmp_path):
+    """SQLite adapter with the sql_audit_log table."""
+    from taskr.db.sqlite import SQLiteAdapter
+
+    adapter = SQLiteAdapter(str(tmp_path / "test.db"))
+    await adapter.connect()
+    await adapter.execute("""
+        CREATE TABLE sql_audit_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sql_text TEXT NOT NULL,
+            reason TEXT NOT NULL,
+            executed_by TEXT NOT NULL,
+            execution_time_ms REAL
+        )
+    """)
+    yield adapter
+    await adapter.close()
+
+
+class TestAuditLogWriter:
+    """Tests for AuditLogWriter."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batch(self, audit_adapter):
+        """Test a full batch is written without waiting for the interval."""
+        writer = AuditLogWriter(batch_size=2, flush_interval=60)
+        writer.start(audit_adapter)
+
+        try:
+            writer.enqueue("SELECT 1", "a", "agent", 1.0)
+            writer.enqueue("SELECT 2", "b", "agent", 2.0)
+            for _ in range(50):
+                if await audit_adapter.fetchval("SELECT COUNT(*) FROM sql_audit_log") == 2:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await audit_adapter.fetchval("SELECT COUNT(*) FROM sql_audit_log") == 2
+        finally:
+            await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_writes_pending_rows(self, audit_adapter):
+        """Test rows still queued at shutdown are written."""
+        writer = AuditLogWriter(batch_size=64, flush_interval=60)
+        writer.start(audit_adapter)
+
+        writer.enqueue("SELECT 1", "a", "agent", 1.0)
+        await writer.aclose()
+
+        assert await audit_adapter.fetchval("SELECT reason FROM sql_audit_log") == "a"
+
+    @pytest.mark.asyncio
+    async def test_drops_when_full(self):
+        """Test enqueue never blocks and counts dropped rows."""
+        writer = AuditLogWriter(batch_size=1, flush_interval=1, max_pending=1)
+
+        writer.enqueue("SELECT 1", "a", "agent", 1.0)
+        writer.enqueue("SELECT 2", "b", "agent", 1.0)
+
+        assert writer.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_caps_sql_text(self, audit_adapter):
+        """Test stored SQL is truncated to cmd_limit."""
+        writer = AuditLogWriter(cmd_limit=5)
+        writer.start(audit_adapter)
+
+        writer.enqueue("SELECT 12345", "a", "agent", 1.0)
+        await writer.aclose()
+
+        assert await audit_adapter.fetchval("SELECT sql_text FROM sql_audit_log") == "SELEC"
+
+    @pytest.mark.asyncio
+    async def test_aclose_keeps_partially_collected_batch(self, audit_adapter):
+        """Test rows the flusher already dequeued survive cancellation."""
+        writer = AuditLogWriter(batch_size=64, flush_interval=60)
+        writer.start(audit_adapter)
+
+        writer.enqueue("SELECT 1", "a", "agent", 1.0)
+        await asyncio.sleep(0.01)  # flusher takes the row and waits for more
+        await writer.aclose()
+
+        assert await audit_adapter.fetchval("SELECT COUNT(*) FROM sql_audit_log") == 1
+
+    @pytest.mark.asyncio
+    async def test_lifespan_writes_rows_queued_before_shutdown(self, audit_adapter):
+        """Test rows enqueued just before the server stops are written on exit."""
+        writer = AuditLogWriter(batch_size=64, flush_interval=60)
+
+        async with writer.lifespan(None):
+            writer.start(audit_adapter)
+            writer.enqueue("SELECT 1", "a", "agent", 1.0)
+            writer.enqueue("SELECT 2", "b", "agent", 2.0)
+
+        assert await audit_adapter.fetchval("SELECT COUNT(*) FROM sql_audit_log") == 2
@@ -5,6 +5,8 @@ Uses mocking to avoid actual API calls.
 Tests both gh CLI path and direct API fallback.
 """
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -26,8 +28,9 @@ class TestGitHubToolsHelpers:
 
     @patch("taskr_mcp.tools.github.gh_api_graphql")
     @patch("taskr_mcp.tools.github.gh_available", return_value=True)
-    def test_graphql_request_uses_gh_when_available(self, mock_gh_available, mock_gh_api):
-        """Test that graphql_request uses gh CLI when available."""
+    @patch("taskr_mcp.tools.github._get_token", return_value=None)
+    def test_graphql_request_uses_gh_when_available(self, mock_token, mock_gh_available, mock_gh_api):
+        """Test that graphql_request uses gh CLI when no token is available."""
         from taskr_mcp.tools.github import graphql_request
 
         mock_gh_api.return_value = {"viewer": {"login": "testuser"}}
@@ -50,6 +53,53 @@ class TestGitHubToolsHelpers:
         assert result == {"viewer": {"login": "testuser"}}
         mock_direct.assert_called_once()
 
+    @patch("taskr_mcp.tools.github._direct_graphql")
+    @patch("taskr_mcp.tools.github.gh_api_graphql")
+    @patch("taskr_mcp.tools.github.gh_available", return_value=True)
+    @patch("taskr_mcp.tools.github._get_token", return_value="test-token")
+    def test_graphql_request_prefers_http_with_token(self, mock_token, mock_gh_available, mock_gh_api, mock_direct):
+        """Test that a token skips the gh subprocess even when gh is available."""
+        from taskr_mcp.tools.github import graphql_request
+
+        mock_direct.return_value = {"viewer": {"login": "testuser"}}
+
+        graphql_request("query { viewer { login } }", {})
+
+        mock_direct.assert_called_once()
+        mock_gh_api.assert_not_called()
+
+    @patch("taskr_mcp.tools.github.subprocess.run")
+    @patch("taskr_mcp.tools.github.gh_available", return_value=True)
+    def test_get_token_reads_gh_token_once(self, mock_gh_available, mock_run, monkeypatch):
+        """Test that the gh CLI token is looked up once and reused."""
+        from taskr_mcp.tools import github
+        github._gh_token = None  # Reset cache
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="gho_abc\n")
+
+        assert github._get_token() == "gho_abc"
+        assert github._get_token() == "gho_abc"
+        mock_run.assert_called_once()
+        github._gh_token = None
+
+
+class TestGhApiGraphql:
+    """Tests for the gh CLI GraphQL path."""
+
+    @patch("taskr_mcp.tools.github.subprocess.run")
+    def test_variables_become_typed_flags(self, mock_run):
+        """Test ints and bools are sent typed, strings raw, and None left out."""
+        from taskr_mcp.tools.github import gh_api_graphql
+
+        mock_run.return_value = MagicMock(returncode=0, stdout='{"data": {}}')
+
+        gh_api_graphql("query", {"owner": "test", "number": 5, "needPr": True, "after": None})
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:5] == ["gh", "api", "graphql", "-f", "query=query"]
+        assert cmd[5:] == ["-f", "owner=test", "-F", "number=5", "-F", "needPr=true"]
+
 
 class TestGhAvailable:
     """Tests for gh_available function."""
@@ -84,6 +134,42 @@ class TestGhAvailable:
 
         assert github.gh_available() is True
 
+    @patch("taskr_mcp.tools.github.subprocess.run")
+    @patch("taskr_mcp.tools.github.shutil.which", return_value="/usr/local/bin/gh")
+    def test_gh_auth_probe_timeout(self, mock_which, mock_run, caplog):
+        """Test a hung auth probe counts as unavailable and is logged."""
+        import subprocess
+
+        from taskr_mcp.tools import github
+        github._gh_available = None  # Reset cache
+
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="gh", timeout=2)
+
+        with caplog.at_level("WARNING", logger="taskr_mcp.tools.github"):
+            assert github.gh_available() is False
+
+        assert mock_run.call_args.kwargs["timeout"] == 2
+        assert "timed out" in caplog.text
+        github._gh_available = None
+
+    @patch("taskr_mcp.tools.github.subprocess.run")
+    @patch("taskr_mcp.tools.github.shutil.which", return_value="/usr/local/bin/gh")
+    def test_negative_result_is_retried_later(self, mock_which, mock_run):
+        """Test a failed probe is cached briefly, then retried."""
+        from taskr_mcp.tools import github
+        github._gh_available = None  # Reset cache
+
+        mock_run.return_value = MagicMock(returncode=1, stderr="not logged in")
+        assert github.gh_available() is False
+        assert github.gh_available() is False
+        assert mock_run.call_count == 1
+
+        mock_run.return_value = MagicMock(returncode=0)
+        github._gh_checked_at -= github._GH_RETRY_SECONDS
+        assert github.gh_available() is True
+        assert mock_run.call_count == 2
+        github._gh_available = None
+
 
 class TestGitHubAuthStatus:
     """Tests for github_auth_status function."""
@@ -124,43 +210,53 @@ class TestGitHubAuthStatus:
 class TestGetOwnerId:
     """Tests for get_owner_id function."""
 
+    def setup_method(self):
+        from taskr_mcp.tools.github import get_owner_id
+        get_owner_id.cache_clear()
+
     @patch("taskr_mcp.tools.github.graphql_request")
     def test_get_org_id(self, mock_graphql):
         """Test getting organization ID."""
         from taskr_mcp.tools.github import get_owner_id
 
-        mock_graphql.return_value = {"organization": {"id": "O_123"}}
+        mock_graphql.return_value = {"org": {"id": "O_123"}, "usr": None}
 
         node_id, node_type = get_owner_id("rhea-impact")
 
         assert node_id == "O_123"
         assert node_type == "organization"
+        mock_graphql.assert_called_once()
+
+    @patch("taskr_mcp.tools.github.graphql_request")
+    def test_get_owner_id_is_cached(self, mock_graphql):
+        """Test repeated lookups for the same login reuse the first result."""
+        from taskr_mcp.tools.github import get_owner_id
+
+        mock_graphql.return_value = {"org": {"id": "O_123"}, "usr": None}
+
+        assert get_owner_id("cached-org") == get_owner_id("cached-org")
+        mock_graphql.assert_called_once()
 
     @patch("taskr_mcp.tools.github.graphql_request")
     def test_get_user_id_fallback(self, mock_graphql):
         """Test falling back to user when org not found."""
         from taskr_mcp.tools.github import get_owner_id
 
-        # First call (org) returns None, second call (user) returns ID
-        mock_graphql.side_effect = [
-            {"organization": None},
-            {"user": {"id": "U_456"}}
-        ]
+        # Both lookups share one request; the org side comes back null
+        mock_graphql.return_value = {"org": None, "usr": {"id": "U_456"}}
 
         node_id, node_type = get_owner_id("testuser")
 
         assert node_id == "U_456"
         assert node_type == "user"
+        mock_graphql.assert_called_once()
 
     @patch("taskr_mcp.tools.github.graphql_request")
     def test_get_owner_id_not_found(self, mock_graphql):
         """Test error when neither org nor user found."""
         from taskr_mcp.tools.github import get_owner_id
 
-        mock_graphql.side_effect = [
-            {"organization": None},
-            {"user": None}
-        ]
+        mock_graphql.return_value = {"org": None, "usr": None}
 
         with pytest.raises(ValueError) as exc:
             get_owner_id("nonexistent")
@@ -168,6 +264,35 @@ class TestGetOwnerId:
         assert "Could not find" in str(exc.value)
 
 
+class TestGraphqlData:
+    """Tests for GraphQL error handling."""
+
+    def test_tolerated_errors_are_ignored(self):
+        """Test errors on tolerated fields leave the field null."""
+        from taskr_mcp.tools.github import _graphql_data
+
+        response = {
+            "data": {"org": None, "usr": {"id": "U_456"}},
+            "errors": [{"type": "NOT_FOUND", "path": ["org"], "message": "Could not resolve"}],
+        }
+
+        assert _graphql_data(response, tolerate=("org", "usr")) == response["data"]
+
+    def test_other_errors_raise(self):
+        """Test errors outside the tolerated fields still raise."""
+        from taskr_mcp.tools.github import _graphql_data
+
+        response = {
+            "data": None,
+            "errors": [{"message": "Bad credentials"}],
+        }
+
+        with pytest.raises(ValueError) as exc:
+            _graphql_data(response, tolerate=("org", "usr"))
+
+        assert "Bad credentials" in str(exc.value)
+
+
 class TestGitHubProjectCreate:
     """Tests for github_project_create tool."""
 
@@ -354,19 +479,90 @@ class TestDirectApiGraphQL:
     @patch("taskr_mcp.tools.github._get_token", return_value="test-token")
     def test_direct_graphql_success(self, mock_token):
         """Test direct GraphQL API call."""
-        import httpx
         from unittest.mock import patch as inner_patch
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"data": {"viewer": {"login": "testuser"}}}
+        mock_response.status_code = 200
+        mock_response.content = b'{"data": {"viewer": {"login": "testuser"}}}'
         mock_response.raise_for_status = MagicMock()
+        mock_client = MagicMock()
+        mock_client.post.return_value = mock_response
 
-        with inner_patch.object(httpx, "post", return_value=mock_response) as mock_post:
+        with inner_patch("taskr_mcp.tools.github._get_http_client", return_value=mock_client):
             from taskr_mcp.tools.github import _direct_graphql
             result = _direct_graphql("query { viewer { login } }", {})
 
             assert result == {"viewer": {"login": "testuser"}}
-            mock_post.assert_called_once()
+            mock_client.post.assert_called_once()
+            assert mock_client.post.call_args.args[0] == "/graphql"
+            body = json.loads(mock_client.post.call_args.kwargs["content"])
+            assert body == {"query": "query { viewer { login } }", "variables": {}}
+
+    @patch("taskr_mcp.tools.github.atexit.register")
+    @patch("taskr_mcp.tools.github.httpx.Client")
+    @patch("taskr_mcp.tools.github.httpx.HTTPTransport")
+    def test_http_client_uses_http2_when_h2_installed(
+        self, mock_transport_cls, mock_client_cls, mock_register
+    ):
+        """Test the shared client enables HTTP/2 only when h2 is importable."""
+        from taskr_mcp.tools import github
+
+        with patch.object(github, "_http_client", None):
+            with patch.object(github, "HAS_H2", True):
+                github._get_http_client()
+            assert mock_transport_cls.call_args.kwargs["http2"] is True
+            assert mock_transport_cls.call_args.kwargs["retries"] == github._API_RETRIES
+            assert mock_client_cls.call_args.kwargs["transport"] is mock_transport_cls.return_value
+
+        with patch.object(github, "_http_client", None):
+            with patch.object(github, "HAS_H2", False):
+                github._get_http_client()
+            assert mock_transport_cls.call_args.kwargs["http2"] is False
+
+    @patch("taskr_mcp.tools.github.time.sleep")
+    @patch("taskr_mcp.tools.github._get_http_client")
+    def test_api_post_retries_when_rate_limited(self, mock_client, mock_sleep):
+        """Test a rate-limited request is retried after the Retry-After delay."""
+        from taskr_mcp.tools.github import _api_post
+
+        limited = MagicMock(status_code=429, headers={"Retry-After": "1"})
+        ok = MagicMock(status_code=200, headers={}, content=b'{"data": {}}')
+        mock_client.return_value.post.side_effect = [limited, ok]
+
+        assert _api_post("/graphql", "test-token", {}) == {"data": {}}
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("taskr_mcp.tools.github.time.time", return_value=1000.0)
+    @patch("taskr_mcp.tools.github.time.sleep")
+    @patch("taskr_mcp.tools.github._get_http_client")
+    def test_api_post_waits_for_rate_limit_reset(self, mock_client, mock_sleep, mock_time):
+        """Test an exhausted primary limit waits until X-RateLimit-Reset."""
+        from taskr_mcp.tools.github import _api_post
+
+        limited = MagicMock(
+            status_code=403,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1012"},
+        )
+        ok = MagicMock(status_code=200, headers={}, content=b'{"data": {}}')
+        mock_client.return_value.post.side_effect = [limited, ok]
+
+        assert _api_post("/graphql", "test-token", {}) == {"data": {}}
+        mock_sleep.assert_called_once_with(12.0)
+
+    @patch("taskr_mcp.tools.github._get_http_client")
+    def test_api_post_error_status(self, mock_client):
+        """Test error statuses raise with the status and body."""
+        from taskr_mcp.tools.github import _api_post
+
+        mock_client.return_value.post.return_value = MagicMock(
+            status_code=401, headers={}, text='{"message": "Bad credentials"}'
+        )
+
+        with pytest.raises(ValueError) as exc:
+            _api_post("/graphql", "test-token", {})
+
+        assert "401" in str(exc.value)
+        assert "Bad credentials" in str(exc.value)
 
     @patch("taskr_mcp.tools.github._get_token", return_value=None)
     def test_direct_graphql_no_token(self, mock_token):
@@ -377,3 +573,315 @@ class TestDirectApiGraphQL:
             _direct_graphql("query { viewer { login } }", {})
 
         assert "gh auth login" in str(exc.value)
+
+
+class _ToolRegistry:
+    """Stands in for FastMCP and keeps registered tool functions by name."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def decorator(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+        return decorator
+
+
+class TestGitHubPRCreateTool:
+    """Tests for the github_pr_create tool handler."""
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    @patch("taskr_mcp.tools.github._get_http_client")
+    @patch("taskr_mcp.tools.github._get_token", return_value="test-token")
+    async def test_pr_create_adds_to_issue_project(self, mock_token, mock_client, mock_graphql):
+        """Test the PR is created over HTTP and added to the linked issue's project."""
+        from taskr_mcp.tools.github import register_github_tools
+
+        mock_client.return_value.post.return_value = MagicMock(
+            status_code=201,
+            content=b'{"number": 10, "html_url": "https://github.com/test/repo/pull/10", "node_id": "PR_1"}'
+        )
+
+        def graphql(query, variables):
+            if "projectItems" in query:
+                assert variables["needPr"] is False
+                project = {"id": "PVT_abc", "title": "Roadmap"}
+                return {"repository": {"issue": {"projectItems": {"nodes": [{"project": project}]}}}}
+            assert variables["contentId"] == "PR_1"
+            return {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}
+
+        mock_graphql.side_effect = graphql
+
+        registry = _ToolRegistry()
+        register_github_tools(registry)
+        result = await registry.tools["github_pr_create"](
+            owner="test", repo="repo", title="Test PR", head="feature", issue=5
+        )
+
+        assert result["pr_number"] == 10
+        assert result["added_to_project"] == "Roadmap"
+        # The PR node ID comes from the REST response, not a lookup
+        assert mock_graphql.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    @patch("taskr_mcp.tools.github._run_gh")
+    @patch("taskr_mcp.tools.github.gh_available", return_value=True)
+    @patch("taskr_mcp.tools.github._get_token", return_value=None)
+    async def test_pr_create_via_gh_looks_up_in_one_query(self, mock_token, mock_gh, mock_run_gh, mock_graphql):
+        """Test the gh path fetches the PR node ID and issue project together."""
+        from taskr_mcp.tools.github import register_github_tools
+
+        mock_run_gh.return_value = (0, "https://github.com/test/repo/pull/10\n", "")
+
+        def graphql(query, variables):
+            if "projectItems" in query:
+                assert variables["needPr"] is True
+                project = {"id": "PVT_abc", "title": "Roadmap"}
+                return {"repository": {
+                    "pullRequest": {"id": "PR_1"},
+                    "issue": {"projectItems": {"nodes": [{"project": project}]}},
+                }}
+            assert variables["contentId"] == "PR_1"
+            return {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}
+
+        mock_graphql.side_effect = graphql
+
+        registry = _ToolRegistry()
+        register_github_tools(registry)
+        result = await registry.tools["github_pr_create"](
+            owner="test", repo="repo", title="Test PR", head="feature", issue=5
+        )
+
+        assert result["pr_number"] == 10
+        assert result["added_to_project"] == "Roadmap"
+        assert mock_graphql.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    @patch("taskr_mcp.tools.github._get_http_client")
+    @patch("taskr_mcp.tools.github._get_token", return_value="test-token")
+    async def test_issue_create_uses_rest_node_id(self, mock_token, mock_client, mock_graphql):
+        """Test the REST issue node ID is used directly for the project mutation."""
+        from taskr_mcp.tools.github import register_github_tools
+
+        mock_client.return_value.post.return_value = MagicMock(
+            status_code=201,
+            content=b'{"number": 42, "html_url": "https://github.com/test/repo/issues/42", "node_id": "I_42"}'
+        )
+        mock_graphql.return_value = {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}
+
+        registry = _ToolRegistry()
+        register_github_tools(registry)
+        result = await registry.tools["github_create_issue_in_project"](
+            owner="test", repo="repo", title="Test Issue", project_id="PVT_abc"
+        )
+
+        assert result["issue_node_id"] == "I_42"
+        mock_graphql.assert_called_once()
+        assert mock_graphql.call_args.args[1] == {"projectId": "PVT_abc", "contentId": "I_42"}
+
+
+class TestGitHubProjectCloseTools:
+    """Tests for the close/reopen tool handlers."""
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    async def test_close_and_reopen_share_one_mutation(self, mock_graphql):
+        """Test close and reopen send the same mutation with the closed flag."""
+        from taskr_mcp.tools.github import _SET_PROJECT_CLOSED_MUTATION, register_github_tools
+
+        project = {"id": "PVT_abc", "title": "Test Project", "closed": True, "url": "https://example"}
+        mock_graphql.return_value = {"updateProjectV2": {"projectV2": project}}
+
+        registry = _ToolRegistry()
+        register_github_tools(registry)
+        await registry.tools["github_project_close"](project_id="PVT_abc")
+        await registry.tools["github_project_reopen"](project_id="PVT_abc")
+
+        calls = mock_graphql.call_args_list
+        assert [c.args[0] for c in calls] == [_SET_PROJECT_CLOSED_MUTATION] * 2
+        assert [c.args[1]["closed"] for c in calls] == [True, False]
+
+
+class TestGitHubGetIssueIdTool:
+    """Tests for the github_get_issue_id tool handler."""
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    async def test_repeat_lookups_are_cached(self, mock_graphql):
+        """Test the same issue is only fetched once."""
+        from taskr_mcp.tools import github
+
+        github._issue_cache.clear()
+        mock_graphql.return_value = {"repository": {"issue": {"id": "I_123", "title": "Test Issue"}}}
+
+        registry = _ToolRegistry()
+        github.register_github_tools(registry)
+        first = await registry.tools["github_get_issue_id"](owner="test", repo="repo", issue_number=1)
+        first["title"] = "mutated by caller"
+        second = await registry.tools["github_get_issue_id"](owner="test", repo="repo", issue_number=1)
+
+        assert second == {"id": "I_123", "title": "Test Issue"}
+        mock_graphql.assert_called_once()
+        github._issue_cache.clear()
+
+
+class TestGitHubGetIssueIdsTool:
+    """Tests for the github_get_issue_ids tool handler."""
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    async def test_fetches_uncached_issues_in_one_request(self, mock_graphql):
+        """Test uncached issues share one aliased query and cached ones are reused."""
+        from taskr_mcp.tools import github
+
+        github._issue_cache.clear()
+        github._issue_cache.set(("test", "repo", 1), {"id": "I_1", "title": "Cached"})
+        mock_graphql.return_value = {
+            "repository": {"i0": {"id": "I_2", "title": "Two"}, "i1": None},
+        }
+
+        registry = _ToolRegistry()
+        github.register_github_tools(registry)
+        result = await registry.tools["github_get_issue_ids"](
+            owner="test", repo="repo", issue_numbers=[1, 2, 3, 2]
+        )
+
+        assert result == {
+            "issues": {1: {"id": "I_1", "title": "Cached"}, 2: {"id": "I_2", "title": "Two"}},
+            "not_found": [3],
+        }
+        mock_graphql.assert_called_once()
+        query, variables = mock_graphql.call_args.args
+        assert "i1: issue(number: $n1)" in query
+        assert variables == {"owner": "test", "repo": "repo", "n0": 2, "n1": 3}
+        assert github._issue_cache.get(("test", "repo", 2)) == {"id": "I_2", "title": "Two"}
+        github._issue_cache.clear()
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request", return_value={"repository": None})
+    async def test_missing_repository_is_an_error(self, mock_graphql):
+        """Test a repository that doesn't exist is reported rather than every issue missing."""
+        from taskr_mcp.tools import github
+
+        github._issue_cache.clear()
+        registry = _ToolRegistry()
+        github.register_github_tools(registry)
+        result = await registry.tools["github_get_issue_ids"](
+            owner="test", repo="nope", issue_numbers=[1]
+        )
+
+        assert "test/nope" in result["error"]
+
+
+class TestGitHubProjectItemsTool:
+    """Tests for the github_project_items tool handler."""
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    async def test_user_project_in_one_request(self, mock_graphql):
+        """Test a user-owned project resolves from the single aliased query."""
+        from taskr_mcp.tools.github import register_github_tools
+
+        mock_graphql.return_value = {
+            "org": None,
+            "usr": {
+                "projectV2": {
+                    "id": "PVT_abc",
+                    "title": "Personal",
+                    "items": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+                        "nodes": [
+                            {"id": "PVTI_1", "fieldValueByName": {"name": "Todo"},
+                             "content": {"number": 1, "title": "Issue 1", "state": "OPEN"}},
+                            {"id": "PVTI_2", "fieldValueByName": {"name": "Done"},
+                             "content": {"number": 2, "title": "Issue 2", "state": "CLOSED"}},
+                        ],
+                    },
+                }
+            },
+        }
+
+        registry = _ToolRegistry()
+        register_github_tools(registry)
+        result = await registry.tools["github_project_items"](org="someone", project_number=1, status="todo")
+
+        assert result["project_title"] == "Personal"
+        assert [item["item_id"] for item in result["items"]] == ["PVTI_1"]
+        mock_graphql.assert_called_once()
+
+
+class TestNumberFromUrl:
+    """Tests for parsing gh create output."""
+
+    def test_parses_issue_and_pr_urls(self):
+        """Test the trailing number is read from issue and PR URLs."""
+        from taskr_mcp.tools.github import _number_from_url
+
+        assert _number_from_url("https://github.com/test/repo/issues/42") == 42
+        assert _number_from_url("https://github.com/test/repo/pull/10") == 10
+
+    def test_unexpected_output_raises(self):
+        """Test unexpected output gives a clear error."""
+        from taskr_mcp.tools.github import _number_from_url
+
+        with pytest.raises(ValueError) as exc:
+            _number_from_url("Creating issue in test/repo")
+
+        assert "gh output" in str(exc.value)
+
+
+class TestRunGh:
+    """Tests for the async gh subprocess helper."""
+
+    @pytest.mark.asyncio
+    async def test_run_gh_captures_output(self):
+        """Test output and exit code come back without blocking the loop."""
+        import asyncio
+
+        from taskr_mcp.tools import github
+
+        real_exec = asyncio.create_subprocess_exec
+
+        async def fake_exec(program, *args, **kwargs):
+            # Stand in echo for gh so the test needs no gh install
+            return await real_exec("echo", *args, **kwargs)
+
+        with patch.object(github.asyncio, "create_subprocess_exec", fake_exec):
+            returncode, stdout, stderr = await github._run_gh(["issue", "create"])
+
+        assert returncode == 0
+        assert stdout.strip() == "issue create"
+        assert stderr == ""
+
+    @pytest.mark.asyncio
+    @patch("taskr_mcp.tools.github.graphql_request")
+    async def test_follows_cursors_past_one_page(self, mock_graphql):
+        """Test limits above 100 are filled from following pages."""
+        from taskr_mcp.tools.github import register_github_tools
+
+        def page(start, count, has_next):
+            nodes = [
+                {"id": f"PVTI_{i}", "fieldValueByName": {"name": "Todo"},
+                 "content": {"number": i, "title": f"Issue {i}", "state": "OPEN"}}
+                for i in range(start, start + count)
+            ]
+            return {"org": {"projectV2": {
+                "id": "PVT_abc",
+                "title": "Big",
+                "items": {"pageInfo": {"hasNextPage": has_next, "endCursor": f"c{start}"}, "nodes": nodes},
+            }}, "usr": None}
+
+        mock_graphql.side_effect = [page(0, 100, True), page(100, 50, True)]
+
+        registry = _ToolRegistry()
+        register_github_tools(registry)
+        result = await registry.tools["github_project_items"](org="test", project_number=1, limit=150)
+
+        assert result["count"] == 150
+        second_vars = mock_graphql.call_args_list[1].args[1]
+        assert second_vars["after"] == "c0"
+        assert second_vars["first"] == 50
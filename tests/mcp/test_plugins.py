@@ -0,0 +1,150 @@
+"""
+Tests for MCP plugin discovery.
+
+Uses mocked entry points so no plugin packages need to be installed.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from taskr.plugins import PluginInfo, TaskrPlugin
+
+
+class _DummyPlugin(TaskrPlugin):
+    """Minimal plugin for discovery tests."""
+
+    @property
+    def info(self) -> PluginInfo:
+        return PluginInfo(name="dummy", version="0.0.1", description="Test plugin")
+
+    def register_tools(self, mcp) -> None:
+        pass
+
+
+def _entry_point(name: str) -> MagicMock:
+    ep = MagicMock()
+    ep.name = name
+    ep.load.return_value = _DummyPlugin
+    return ep
+
+
+class TestDiscoverPlugins:
+    """Tests for discover_plugins()."""
+
+    def test_loads_all_without_filter(self):
+        """Test that every entry point is loaded when no names are given."""
+        from taskr_mcp.plugins import discover_plugins
+
+        eps = [_entry_point("dummy"), _entry_point("other")]
+        with patch("importlib.metadata.entry_points", return_value=eps):
+            plugins = discover_plugins()
+
+        assert len(plugins) == 2
+        assert all(ep.load.called for ep in eps)
+
+    def test_skips_disabled_without_importing(self):
+        """Test that entry points outside the enabled set are never loaded."""
+        from taskr_mcp.plugins import discover_plugins
+
+        enabled, disabled = _entry_point("dummy"), _entry_point("other")
+        with patch("importlib.metadata.entry_points", return_value=[enabled, disabled]):
+            plugins = discover_plugins({"dummy"})
+
+        assert len(plugins) == 1
+        enabled.load.assert_called_once()
+        disabled.load.assert_not_called()
+
+
+class TestRunPluginMigrations:
+    """Tests for run_plugin_migrations()."""
+
+    @pytest.mark.asyncio
+    async def test_applies_each_plugins_files_in_order(self, tmp_path):
+        """Test migrations from several plugins are all applied."""
+        from taskr.db.sqlite import SQLiteAdapter
+        from taskr_mcp.plugins import run_plugin_migrations
+
+        adapter = SQLiteAdapter(str(tmp_path / "test.db"))
+        await adapter.connect()
+
+        try:
+            first = tmp_path / "001_a.sql"
+            first.write_text("CREATE TABLE a (id TEXT);\n-- comment\nINSERT INTO a VALUES ('x');")
+            second = tmp_path / "001_b.sql"
+            second.write_text("CREATE TABLE b (id TEXT);")
+
+            plugin_a, plugin_b = _DummyPlugin(), _DummyPlugin()
+            plugin_a.get_migrations = lambda: [str(first)]
+            plugin_b.get_migrations = lambda: [str(second)]
+
+            with patch("taskr.db.get_adapter", return_value=adapter):
+                await run_plugin_migrations([plugin_a, plugin_b])
+
+            assert await adapter.fetchval("SELECT id FROM a") == "x"
+            assert await adapter.fetchval("SELECT COUNT(*) FROM b") == 0
+        finally:
+            await adapter.close()
+
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_other_plugins(self, tmp_path):
+        """Test one plugin's failure stops the others before their next file."""
+        from taskr_mcp.plugins import run_plugin_migrations
+
+        cancelled, executed = [], []
+
+        class _Adapter:
+            async def execute_script(self, sql):
+                executed.append(sql)
+                if sql == "FAIL":
+                    raise RuntimeError("boom")
+                if sql == "SLOW":
+                    try:
+                        await asyncio.sleep(10)
+                    except asyncio.CancelledError:
+                        cancelled.append(sql)
+                        raise
+
+        files = {}
+        for name in ("fail", "slow", "after"):
+            files[name] = tmp_path / f"{name}.sql"
+            files[name].write_text(name.upper())
+
+        failing, slow = _DummyPlugin(), _DummyPlugin()
+        failing.get_migrations = lambda: [str(files["fail"])]
+        slow.get_migrations = lambda: [str(files["slow"]), str(files["after"])]
+
+        with patch("taskr.db.get_adapter", return_value=_Adapter()):
+            with pytest.raises(RuntimeError, match="boom"):
+                await run_plugin_migrations([slow, failing])
+
+        assert cancelled == ["SLOW"]
+        assert "AFTER" not in executed
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class TestDiscoverPluginsWarnings:
+    """Tests for discovery diagnostics."""
+
+    def test_warns_when_enabled_name_has_no_entry_point(self, caplog):
+        """Test a warning is logged for an enabled name with no matching entry point."""
+        from taskr_mcp.plugins import discover_plugins
+
+        with patch("importlib.metadata.entry_points", return_value=[_entry_point("dummy")]):
+            with caplog.at_level("WARNING", logger="taskr_mcp.plugins"):
+                plugins = discover_plugins({"dummy", "missing"})
+
+        assert len(plugins) == 1
+        assert "missing" in caplog.text
+
+    def test_warns_when_entry_point_name_differs(self, caplog):
+        """Test a warning is logged when PluginInfo.name differs from the entry point."""
+        from taskr_mcp.plugins import discover_plugins
+
+        with patch("importlib.metadata.entry_points", return_value=[_entry_point("alias")]):
+            with caplog.at_level("WARNING", logger="taskr_mcp.plugins"):
+                discover_plugins()
+
+        assert "must match PluginInfo.name" in caplog.text